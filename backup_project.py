@@ -2,16 +2,32 @@
 """
 Project Backup Script
 
-Creates a zip backup of the project, excluding temporary files,
+Creates a backup archive of the project, excluding temporary files,
 compiled artifacts, and large data directories.
 Will overwrite existing backup file if present.
+
+The archive is a zstd-compressed tarball (extended_MM.tar.zst) when the
+optional `zstandard` package is installed, otherwise a zip (extended_MM.zip).
+
+Usage:
+    python backup_project.py [project_dir] [compresslevel]
 """
 
 import os
+import functools
+import re
+import tarfile
+import time
 import zipfile
+from contextlib import contextmanager
 from pathlib import Path
 import fnmatch
 
+try:
+    import zstandard as zstd
+except ImportError:  # Optional: fall back to zip/DEFLATE
+    zstd = None
+
 # Patterns to exclude (directories and files)
 EXCLUDE_PATTERNS = [
     # Rust build artifacts
@@ -64,51 +80,203 @@ EXCLUDE_PATTERNS = [
 
     # Backup files (don't backup backups!)
     'backup_*.zip',
+    'backup_*.tar.zst',
     'extended_MM.zip',
+    'extended_MM.tar.zst',
+
+    # Local deploy state (see deploy.py)
+    '.deploy_cache.json',
 ]
 
-def should_exclude(path, base_path):
+# Compression level for the archive (zstd or DEFLATE). Level 3 is much faster
+# than zlib's default (6) and only a few percent larger on source trees; it is
+# also zstd's own default level.
+DEFAULT_COMPRESSLEVEL = 3
+
+# Minimum seconds between progress lines (stdout can be a slow pipe)
+PROGRESS_INTERVAL = 0.5
+
+# Copy buffer for streaming file data into the tar archive (tarfile defaults to 16 KiB)
+COPY_BUFSIZE = 1 << 20
+
+# Already-compressed formats: stored as-is in zip backups, DEFLATE can't shrink them
+STORED_EXTENSIONS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.mp4',
+    '.zip', '.whl', '.gz', '.tgz', '.bz2', '.xz', '.zst', '.7z',
+})
+
+def _is_glob(pattern):
+    """Return True if pattern contains fnmatch wildcards."""
+    return any(c in pattern for c in '*?[')
+
+def _compile_globs(patterns):
+    """Compile fnmatch patterns into one case-normalized regex alternation (None if empty)."""
+    if not patterns:
+        return None
+    return re.compile('|'.join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
+
+# EXCLUDE_PATTERNS partitioned once at import: exact names are hash lookups,
+# wildcards share a single compiled regex. Names are os.path.normcase'd to keep
+# fnmatch's case-insensitive matching on Windows.
+_DIR_PATTERNS = [p.rstrip('/\\') for p in EXCLUDE_PATTERNS if p.endswith(('/', '\\'))]
+_FILE_PATTERNS = [p for p in EXCLUDE_PATTERNS if not p.endswith(('/', '\\'))]
+
+EXCLUDE_DIRS = frozenset(os.path.normcase(p) for p in _DIR_PATTERNS if not _is_glob(p))
+EXCLUDE_DIRS_RE = _compile_globs([p for p in _DIR_PATTERNS if _is_glob(p)])
+EXCLUDE_FILES = frozenset(os.path.normcase(p) for p in _FILE_PATTERNS if not _is_glob(p))
+EXCLUDE_FILES_RE = _compile_globs([p for p in _FILE_PATTERNS if _is_glob(p)])
+
+def _matches_dir_pattern(name):
+    """Return True if a (normcased) path component matches a directory pattern."""
+    if name in EXCLUDE_DIRS:
+        return True
+    return EXCLUDE_DIRS_RE is not None and EXCLUDE_DIRS_RE.match(name) is not None
+
+@functools.lru_cache(maxsize=None)
+def _dir_excluded(rel_dir):
+    """
+    Directory-pattern decision for a (normcased) relative directory.
+
+    Exclusion is prefix-monotone, so the result is memoized per directory and
+    each file only pays for its own name: O(unique dirs) pattern checks.
+    """
+    if not rel_dir:
+        return False
+    parent, _, name = rel_dir.rpartition(os.sep)
+    return _dir_excluded(parent) or _matches_dir_pattern(name)
+
+def should_exclude(rel_path):
     """
     Check if a path should be excluded based on patterns.
 
     Args:
-        path: Path object to check
-        base_path: Base project directory Path object
+        rel_path: Path relative to the project directory (str, os.sep separated)
 
     Returns:
         bool: True if path should be excluded
     """
-    # Get relative path
-    try:
-        rel_path = path.relative_to(base_path)
-    except ValueError:
+    rel_path = os.path.normcase(rel_path)
+    parent, _, name = rel_path.rpartition(os.sep)
+
+    # File patterns: exact names, then wildcards against full path or name
+    if name in EXCLUDE_FILES:
         return True
+    if EXCLUDE_FILES_RE is not None and (EXCLUDE_FILES_RE.match(rel_path) or EXCLUDE_FILES_RE.match(name)):
+        return True
+
+    # Directory patterns (end with /): check if any part of the path matches
+    return _dir_excluded(parent) or _matches_dir_pattern(name)
 
-    rel_path_str = str(rel_path)
-
-    # Check each pattern
-    for pattern in EXCLUDE_PATTERNS:
-        # Directory patterns (end with /)
-        if pattern.endswith('/') or pattern.endswith('\\'):
-            pattern_clean = pattern.rstrip('/\\')
-            # Check if any part of the path matches
-            for part in rel_path.parts:
-                if fnmatch.fnmatch(part, pattern_clean):
-                    return True
-        # File patterns
-        else:
-            if fnmatch.fnmatch(rel_path_str, pattern) or fnmatch.fnmatch(path.name, pattern):
-                return True
-
-    return False
-
-def create_backup(project_dir=None, output_dir=None):
+def is_excluded_dir_name(name):
     """
-    Create a zip backup of the project.
+    Check if a directory should be pruned, by basename only.
+
+    The walk never descends into excluded directories, so a directory's
+    ancestors have already passed and its basename alone decides.
+
+    Args:
+        name: Directory basename
+
+    Returns:
+        bool: True if the directory should not be descended into
+    """
+    name = os.path.normcase(name)
+    if _matches_dir_pattern(name) or name in EXCLUDE_FILES:
+        return True
+    return EXCLUDE_FILES_RE is not None and EXCLUDE_FILES_RE.match(name) is not None
+
+def iter_files(project_dir):
+    """
+    Walk the project with os.scandir, pruning excluded directories.
+
+    DirEntry caches the file type (and, on Windows, stat) from the directory
+    listing, so no extra stat calls or Path objects are needed per file.
+
+    Args:
+        project_dir: Base project directory
+
+    Yields:
+        tuple: (DirEntry, rel_path) for each regular file, rel_path os.sep separated
+    """
+    project_dir = os.fspath(project_dir)
+    base_len = len(os.path.join(project_dir, ''))
+    stack = [project_dir]
+
+    while stack:
+        dir_path = stack.pop()
+        try:
+            it = os.scandir(dir_path)
+        except (PermissionError, FileNotFoundError) as e:
+            print(f"  Warning: Could not read {dir_path}: {e}")
+            continue
+
+        with it:
+            for entry in it:
+                if entry.is_dir():
+                    # Prune by basename before any path work; like os.walk,
+                    # never descend into symlinked directories
+                    if not entry.is_symlink() and not is_excluded_dir_name(entry.name):
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry, entry.path[base_len:]
+
+@contextmanager
+def open_archive(backup_path, compresslevel):
+    """
+    Open the backup archive for writing.
+
+    Uses a streamed .tar.zst (multi-threaded zstd) when `zstandard` is
+    available, otherwise a DEFLATE zip.
+
+    Args:
+        backup_path: Output archive Path
+        compresslevel: Compression level for the selected codec
+
+    Yields:
+        callable: add_files(entries) taking (file_path, arc_name, stat) tuples and
+        yielding (arc_name, file_size, error) per file, in order
+    """
+    if zstd is not None:
+        cctx = zstd.ZstdCompressor(level=compresslevel, threads=-1)
+        with open(backup_path, 'wb') as fh, cctx.stream_writer(fh) as compressor, \
+                tarfile.open(fileobj=compressor, mode='w|', bufsize=COPY_BUFSIZE,
+                             copybufsize=COPY_BUFSIZE) as tar:
+            def add_files(entries):
+                for file_path, arc_name, st in entries:
+                    try:
+                        tar.add(file_path, arcname=arc_name.replace(os.sep, '/'), recursive=False)
+                        yield arc_name, st.st_size, None
+                    except (PermissionError, FileNotFoundError) as e:
+                        yield arc_name, 0, e
+            yield add_files
+    else:
+        # zipfile compresses with stdlib zlib only. libdeflate, or compressing
+        # entries in worker processes, would mean appending precompressed data
+        # through ZipFile's private internals; the zstd tarball above is the
+        # multi-threaded path.
+        with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel, allowZip64=True) as zipf:
+            def add_files(entries):
+                # zipf.write streams each file, so only one buffer is in memory
+                for file_path, arc_name, st in entries:
+                    if os.path.splitext(arc_name)[1].lower() in STORED_EXTENSIONS:
+                        compress_type = zipfile.ZIP_STORED
+                    else:
+                        compress_type = zipfile.ZIP_DEFLATED
+                    try:
+                        zipf.write(file_path, arc_name, compress_type=compress_type)
+                        yield arc_name, st.st_size, None
+                    except (PermissionError, FileNotFoundError) as e:
+                        yield arc_name, 0, e
+            yield add_files
+
+def create_backup(project_dir=None, output_dir=None, compresslevel=DEFAULT_COMPRESSLEVEL):
+    """
+    Create a backup archive of the project.
 
     Args:
         project_dir: Directory to backup (default: current directory)
         output_dir: Where to save backup (default: same as project_dir)
+        compresslevel: zstd level 1-22 or DEFLATE level 0-9 (default: 3)
     """
     # Set default paths
     if project_dir is None:
@@ -122,12 +290,13 @@ def create_backup(project_dir=None, output_dir=None):
         output_dir = Path(output_dir)
 
     # Create backup filename (without timestamp - will overwrite existing)
-    backup_filename = "extended_MM.zip"
+    backup_filename = "extended_MM.tar.zst" if zstd is not None else "extended_MM.zip"
     backup_path = output_dir / backup_filename
 
     print(f"Creating backup of: {project_dir}")
     print(f"Output file: {backup_path}")
     print(f"Excluding patterns: {len(EXCLUDE_PATTERNS)} patterns")
+    print(f"Compression level: {compresslevel}")
     print()
 
     # Statistics
@@ -135,39 +304,40 @@ def create_backup(project_dir=None, output_dir=None):
     files_excluded = 0
     total_size = 0
 
-    # Create zip file
-    with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        # Walk through directory
-        for root, dirs, files in os.walk(project_dir):
-            root_path = Path(root)
-
-            # Filter out excluded directories (modifies dirs in-place to prevent descent)
-            dirs[:] = [d for d in dirs if not should_exclude(root_path / d, project_dir)]
-
-            # Process files
-            for file in files:
-                file_path = root_path / file
-
-                # Check if file should be excluded
-                if should_exclude(file_path, project_dir):
-                    files_excluded += 1
-                    continue
-
-                # Get relative path for zip archive
-                arc_name = file_path.relative_to(project_dir)
-
-                # Add to zip
-                try:
-                    zipf.write(file_path, arc_name)
-                    file_size = file_path.stat().st_size
-                    total_size += file_size
-                    files_added += 1
-
-                    # Print progress every 10 files
-                    if files_added % 10 == 0:
-                        print(f"  Added {files_added} files... ({total_size / 1024 / 1024:.2f} MB)")
-                except Exception as e:
-                    print(f"  Warning: Could not add {arc_name}: {e}")
+    # Walk through directory and collect files to archive
+    entries = []
+    for entry, arc_name in iter_files(project_dir):
+        # Check if file should be excluded
+        if should_exclude(arc_name):
+            files_excluded += 1
+            continue
+
+        # DirEntry.stat() is cached (free on Windows, one call on POSIX) and
+        # reused for size accounting instead of re-stat'ing
+        try:
+            st = entry.stat()
+        except (PermissionError, FileNotFoundError) as e:
+            print(f"  Warning: Could not add {arc_name}: {e}")
+            continue
+
+        entries.append((entry.path, arc_name, st))
+
+    # Create archive
+    last_progress = time.monotonic()
+    with open_archive(backup_path, compresslevel) as add_files:
+        for arc_name, file_size, error in add_files(entries):
+            if error is not None:
+                print(f"  Warning: Could not add {arc_name}: {error}")
+                continue
+
+            total_size += file_size
+            files_added += 1
+
+            # Print progress at most every PROGRESS_INTERVAL seconds
+            now = time.monotonic()
+            if now - last_progress >= PROGRESS_INTERVAL:
+                print(f"  Added {files_added} files... ({total_size / 1024 / 1024:.2f} MB)")
+                last_progress = now
 
     # Print summary
     print()
@@ -190,4 +360,10 @@ if __name__ == "__main__":
     else:
         project_dir = None
 
-    create_backup(project_dir)
+    # Optional compression level as second argument
+    if len(sys.argv) > 2:
+        compresslevel = int(sys.argv[2])
+    else:
+        compresslevel = DEFAULT_COMPRESSLEVEL
+
+    create_backup(project_dir, compresslevel=compresslevel)
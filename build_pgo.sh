@@ -0,0 +1,82 @@
+#!/bin/bash
+# Profile-guided optimization (PGO) build of the bot and the Cython GARCH kernel
+#
+# Stage 1 builds instrumented binaries and runs a canned workload that exercises
+# GARCH fitting and order signing; stage 2 rebuilds using the recorded profiles.
+# Both stages target the build machine's CPU, so run this on (a machine like)
+# the one the bot runs on.
+#
+# Usage:
+#   ./build_pgo.sh            # Rust bot + Cython kernel (if Cython is installed)
+#   PGO_ROUNDS=50 ./build_pgo.sh
+#
+# Requires llvm-profdata matching rustc's LLVM:
+#   rustup component add llvm-tools-preview
+
+set -euo pipefail
+cd "$(dirname "$0")"
+
+PGO_DIR="$PWD/target/pgo-profiles"
+PGO_ROUNDS="${PGO_ROUNDS:-20}"
+
+LLVM_PROFDATA="${LLVM_PROFDATA:-$(find "$(rustc --print sysroot)" -name llvm-profdata -type f 2>/dev/null | head -n 1)}"
+if [ -z "$LLVM_PROFDATA" ]; then
+    echo "llvm-profdata not found. Install it with: rustup component add llvm-tools-preview" >&2
+    exit 1
+fi
+
+rm -rf "$PGO_DIR"
+mkdir -p "$PGO_DIR"
+
+echo "=== Rust stage 1: instrumented build ==="
+RUSTFLAGS="-C target-cpu=native -C profile-generate=$PGO_DIR/rust" \
+    cargo build --release --example pgo_workload
+
+echo "=== Rust stage 1: collecting profile ==="
+./target/release/examples/pgo_workload "$PGO_ROUNDS"
+"$LLVM_PROFDATA" merge -o "$PGO_DIR/rust.profdata" "$PGO_DIR/rust"
+
+echo "=== Rust stage 2: optimized build ==="
+# The profile comes from the example binary; the bot shares the library code
+# it exercises (garch, snip12)
+RUSTFLAGS="-C target-cpu=native -C profile-use=$PGO_DIR/rust.profdata" \
+    cargo build --release --bin market_maker_bot --example pgo_workload
+./target/release/examples/pgo_workload "$PGO_ROUNDS"
+
+if ! python3 -c "import Cython" 2>/dev/null; then
+    echo "Cython not installed; skipping the _garch kernel (garch_kernel.py will use numba)"
+    exit 0
+fi
+
+GARCH_WORKLOAD='
+import sys
+import numpy as np
+sys.path.insert(0, "scripts")
+import garch_forecast
+
+# Synthetic GARCH(1,1) returns with fat-tailed shocks
+rng = np.random.default_rng(0)
+n = 2000 + 50 * int(sys.argv[1])
+h, returns = 1e-7 / 0.02, np.empty(n)
+for t in range(n):
+    returns[t] = np.sqrt(h) * rng.standard_t(5) * np.sqrt(3 / 5)
+    h = 1e-7 + 0.08 * returns[t] ** 2 + 0.9 * h
+
+for i in range(int(sys.argv[1])):
+    window = returns[50 * i:50 * i + 2000]
+    for dist in ("studentst", "normal"):
+        garch_forecast.fit_garch_and_forecast(
+            window, dist, [0.0, 1e-7, 0.08, 0.9], n_jobs=1, use_cache=False, seed=i
+        )
+'
+
+echo "=== Cython stage 1: instrumented build ==="
+GARCH_PGO=generate GARCH_PGO_DIR="$PGO_DIR/garch" python3 scripts/setup.py build_ext --inplace --force
+
+echo "=== Cython stage 1: collecting profile ==="
+python3 -c "$GARCH_WORKLOAD" "$PGO_ROUNDS"
+
+echo "=== Cython stage 2: optimized build ==="
+GARCH_PGO=use GARCH_PGO_DIR="$PGO_DIR/garch" python3 scripts/setup.py build_ext --inplace --force
+
+echo "Done: target/release/market_maker_bot and scripts/_garch are PGO builds"
@@ -1,13 +1,14 @@
 """
 Extended DEX Connector Deployment Script (Rust)
 
-Deploys the Rust library and market making bot to remote VPS using scp with tar compression over SSH.
+Deploys the Rust library and market making bot to remote VPS by streaming a tar.gz over SSH.
 Cross-platform compatible (Windows, Linux, macOS).
 
 Deployment process:
-- Creates compressed tar.gz archive locally (with exclusions)
-- Transfers single archive file via scp (efficient single-file transfer)
-- Extracts archive on remote server
+- Streams a compressed tar.gz archive (with exclusions) over SSH
+- Extracts it on the remote server as it arrives (no local or remote temp file)
+- Only ships files changed since the last deploy to the same target
+  (tracked in .deploy_cache.json; pass --full to resend everything)
 - Falls back to rsync if available (faster incremental updates)
 
 What gets deployed:
@@ -32,6 +33,7 @@ What gets excluded (NEVER overwrites on remote):
 - Deployment scripts (deploy.py, backup_project.py)
 - Temporary files (nul, *.swp, *.swo, .DS_Store)
 - Backup archives (backup_*.zip)
+- Local deploy state (.deploy_cache.json)
 
 After deployment, you can choose either:
 
@@ -50,13 +52,19 @@ IMPORTANT: The data/ directory is EXCLUDED to preserve remote historical CSV dat
 The bot will create data/ and CSV files automatically on the remote server.
 
 Usage:
-    python deploy.py
+    python deploy.py [--full]
 """
 
 import os
+import re
 import sys
+import json
+import fnmatch
+import shutil
 import subprocess
 import platform
+import threading
+import time
 from pathlib import Path
 
 # Configuration
@@ -83,6 +91,21 @@ def find_ssh_key():
 
 SSH_KEY = find_ssh_key()
 
+# Common ssh options shared by every ssh/rsync invocation
+SSH_OPTS = [
+    "-o", "StrictHostKeyChecking=no",
+    "-o", "ConnectTimeout=30",
+]
+
+# Reuse one authenticated connection across the deploy's ssh calls
+# (connection test, mkdir, transfer). OpenSSH on Windows has no ControlMaster.
+if platform.system() != "Windows":
+    SSH_OPTS += [
+        "-o", "ControlMaster=auto",
+        "-o", "ControlPath=/tmp/ssh-mm-%r@%h:%p",
+        "-o", "ControlPersist=60s",
+    ]
+
 # Files that must always be shipped even if they match an exclusion rule
 INCLUDE_ALWAYS = {
     ".env",  # User explicitly requested .env transfer
@@ -117,10 +140,86 @@ EXCLUDE_PATTERNS = [
     'backup_project.py',  # Don't upload backup script
     'backup_*.zip',  # Don't upload backup archives
     'CLAUDE_LONG.md',  # Don't upload long version of docs
+    '.deploy_cache.json',  # Local incremental deploy state
 ]
 
+# (mtime, size) of every file shipped by the last successful tar deploy,
+# used to skip unchanged files on the next run
+DEPLOY_CACHE_FILE = ".deploy_cache.json"
+
 # Docker files (Dockerfile, docker-compose.yml, .dockerignore, DOCKER.md) are ALWAYS included
 
+# EXCLUDE_PATTERNS bucketed by kind once, so the tar filter does set lookups and
+# a single regex match per entry instead of re-parsing every pattern
+EXCLUDE_DIRS = frozenset(p.rstrip('/') for p in EXCLUDE_PATTERNS if p.endswith('/'))
+EXCLUDE_WILDCARDS = [p for p in EXCLUDE_PATTERNS if not p.endswith('/') and '*' in p]
+EXCLUDE_EXACT = frozenset(p for p in EXCLUDE_PATTERNS if not p.endswith('/') and '*' not in p)
+# fnmatch is case-insensitive where the filesystem is (Windows); keep that behavior
+EXCLUDE_WILDCARD_RE = re.compile(
+    '|'.join(fnmatch.translate(p) for p in EXCLUDE_WILDCARDS),
+    re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+)
+
+# gzip level for the deployment archive (level 3 is much faster than tarfile's default 9)
+GZIP_COMPRESSLEVEL = 3
+
+# Seconds without any archive data written before a tar-over-ssh transfer is killed
+TRANSFER_STALL_TIMEOUT = 120
+
+
+class StallWatchdog:
+    """
+    Call `on_stall` once no progress has been reported for `timeout` seconds.
+
+    Every touch() re-arms the timeout, so a long transfer that keeps moving
+    is never killed; only inactivity counts.
+    """
+
+    def __init__(self, timeout, on_stall):
+        self.timeout = timeout
+        self.on_stall = on_stall
+        self.fired = threading.Event()
+        self._done = threading.Event()
+        self._last = time.monotonic()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def touch(self):
+        """Record progress, re-arming the timeout."""
+        self._last = time.monotonic()
+
+    def start(self):
+        self.touch()
+        self._thread.start()
+
+    def cancel(self):
+        self._done.set()
+
+    def _run(self):
+        while True:
+            remaining = self._last + self.timeout - time.monotonic()
+            if remaining <= 0:
+                self.fired.set()
+                self.on_stall()
+                return
+            if self._done.wait(remaining):
+                return
+
+
+class ProgressWriter:
+    """Write-only file wrapper that touches a StallWatchdog after every chunk written."""
+
+    def __init__(self, fileobj, watchdog):
+        self.fileobj = fileobj
+        self.watchdog = watchdog
+
+    def write(self, data):
+        written = self.fileobj.write(data)
+        self.watchdog.touch()
+        return written
+
+    def flush(self):
+        self.fileobj.flush()
+
 
 def print_header(text):
     """Print a formatted header."""
@@ -149,6 +248,46 @@ def print_info(text):
     print(f"[INFO] {text}")
 
 
+def run_streaming(cmd, timeout):
+    """
+    Run a command, echoing its combined stdout/stderr line by line as it arrives.
+
+    Unlike subprocess.run(capture_output=True), failures show up immediately
+    instead of after the process exits or the timeout expires.
+
+    Raises subprocess.TimeoutExpired if the command is killed after `timeout` seconds.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    )
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        proc.kill()
+
+    watchdog = threading.Timer(timeout, kill)
+    watchdog.start()
+    output = []
+    try:
+        for line in proc.stdout:
+            print(f"  {line}", end="")
+            output.append(line)
+        proc.wait()
+    finally:
+        watchdog.cancel()
+        proc.stdout.close()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, output="".join(output))
+
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout="".join(output))
+
+
 def check_ssh_key():
     """Check if SSH key exists and set proper permissions."""
     if SSH_KEY is None:
@@ -180,29 +319,22 @@ def test_ssh_connection():
     cmd = [
         "ssh",
         "-i", SSH_KEY,
-        "-o", "ConnectTimeout=30",
-        "-o", "StrictHostKeyChecking=no",
+        *SSH_OPTS,
         f"{REMOTE_USER}@{REMOTE_HOST}",
         "echo 'Connection successful'"
     ]
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        result = run_streaming(cmd, timeout=60)
 
         if result.returncode == 0:
             print_success("SSH connection successful")
             return True
         else:
+            # ssh's error output has already been echoed above
             print_error("Cannot connect to remote server")
             print(f"Host: {REMOTE_USER}@{REMOTE_HOST}")
             print(f"Key: {SSH_KEY}")
-            if result.stderr:
-                print(f"Error: {result.stderr}")
             return False
     except subprocess.TimeoutExpired:
         print_error("SSH connection timed out after 60 seconds")
@@ -222,24 +354,18 @@ def create_remote_directory():
     cmd = [
         "ssh",
         "-i", SSH_KEY,
-        "-o", "ConnectTimeout=30",
-        "-o", "StrictHostKeyChecking=no",
+        *SSH_OPTS,
         f"{REMOTE_USER}@{REMOTE_HOST}",
         f"mkdir -p {REMOTE_PATH}"
     ]
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+        result = run_streaming(cmd, timeout=60)
         if result.returncode == 0:
             print_success(f"Remote directory ready: {REMOTE_PATH}")
             return True
         else:
-            print_error(f"Failed to create remote directory: {result.stderr}")
+            print_error(f"Failed to create remote directory (exit code {result.returncode})")
             return False
     except subprocess.TimeoutExpired:
         print_error("Remote directory creation timed out after 60 seconds")
@@ -262,21 +388,50 @@ def check_rsync_available():
         return False
 
 
+def rsync_version():
+    """Return the local rsync version as a tuple of ints, e.g. (3, 2, 7), or None."""
+    try:
+        result = subprocess.run(["rsync", "--version"], capture_output=True, text=True)
+    except FileNotFoundError:
+        return None
+    # "rsync  version 2.6.9 ..." or, since 3.2, "rsync  version v3.2.7 ..."
+    match = re.search(r"version\s+v?(\d+)\.(\d+)(?:\.(\d+))?", result.stdout)
+    if not match:
+        return None
+    return tuple(int(part or 0) for part in match.groups())
+
+
 def deploy_with_rsync():
     """Deploy using rsync (faster, incremental)."""
     print_info("Deploying using rsync (incremental sync)...")
 
-    # Build exclude arguments
+    # Build exclude arguments. EXCLUDE_PATTERNS replaces --filter=':- .gitignore':
+    # .gitignore lists Cargo.lock, which is deployed on purpose, and keeps the
+    # rsync and tar paths on one list of excludes
     exclude_args = []
     for pattern in EXCLUDE_PATTERNS:
         exclude_args.extend(["--exclude", pattern])
 
+    # Deleting remote files not present locally is opt-in (RSYNC_DELETE=1):
+    # it would wipe remote-only files that no exclude pattern covers
+    delete_args = ["--delete"] if os.environ.get("RSYNC_DELETE") == "1" else []
+    if delete_args:
+        print_warning("RSYNC_DELETE=1 - remote files missing locally will be deleted")
+
+    # --info=progress2 (one overall progress line) needs rsync >= 3.1; older
+    # clients such as macOS's stock 2.6.9 reject it, so fall back to --progress
+    version = rsync_version()
+    progress_args = ["--info=progress2"] if version and version >= (3, 1) else ["--progress"]
+
     cmd = [
         "rsync",
-        "-avz",
-        "--progress",
-        "--delete",
-        "-e", f"ssh -i {SSH_KEY} -o StrictHostKeyChecking=no -o ConnectTimeout=30",
+        "-a",
+        "-z", "--compress-level=3",  # Cheaper than the default level 6
+        *progress_args,
+        "--partial",
+        "--inplace",
+        *delete_args,
+        "-e", " ".join(["ssh", "-i", SSH_KEY, *SSH_OPTS]),
         *exclude_args,
         f"{LOCAL_PATH}/",
         f"{REMOTE_USER}@{REMOTE_HOST}:{REMOTE_PATH}/"
@@ -293,120 +448,184 @@ def deploy_with_rsync():
         return False
 
 
-def deploy_with_scp():
-    """Deploy using scp with tar compression (efficient single-file transfer)."""
-    print_info("Deploying using scp with tar compression...")
+def is_excluded(path_str, base_name, parts):
+    """Check a tar entry against EXCLUDE_PATTERNS (precomputed buckets)."""
+    # Directory pattern - check if any directory name matches
+    if not EXCLUDE_DIRS.isdisjoint(parts):
+        return True
 
-    import tempfile
-    import tarfile
+    # Wildcard patterns
+    if EXCLUDE_WILDCARD_RE.match(path_str) or EXCLUDE_WILDCARD_RE.match(base_name):
+        return True
+
+    # Exact filename match (basename only: a substring test would also
+    # exclude e.g. 'null_check.rs' for 'nul' or 'redeploy.py' for 'deploy.py')
+    return base_name in EXCLUDE_EXACT
+
+
+def deploy_target():
+    """Identify the remote deploy destination (cache is only valid for the same one)."""
+    return f"{REMOTE_USER}@{REMOTE_HOST}:{REMOTE_PATH}"
+
+
+def load_deploy_cache():
+    """Load {archive name: [mtime, size]} from the last successful deploy to this target."""
+    try:
+        with open(DEPLOY_CACHE_FILE, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if cache.get("target") != deploy_target():
+        return {}
+    return cache.get("files", {})
 
-    # Create temporary tar file
-    with tempfile.NamedTemporaryFile(suffix='.tar.gz', delete=False) as tmp_tar:
-        tar_path = tmp_tar.name
 
+def save_deploy_cache(files):
+    """Atomically persist the shipped file states for the next incremental deploy."""
+    tmp_path = DEPLOY_CACHE_FILE + ".tmp"
     try:
-        print_info("Creating compressed archive...")
+        with open(tmp_path, "w") as f:
+            json.dump({"target": deploy_target(), "files": files}, f)
+        os.replace(tmp_path, DEPLOY_CACHE_FILE)
+    except OSError as e:
+        print_warning(f"Could not save deploy cache: {e}")
+
+
+def deploy_with_scp(full=False):
+    """
+    Deploy by streaming a tar.gz over SSH straight into a remote `tar -x` (no temp file).
+
+    Files whose (mtime, size) match the last successful deploy to the same
+    target are left out; extraction overlays the rest. `full=True` resends all.
+    """
+    print_info("Deploying by streaming tar archive over SSH...")
+
+    import gzip
+    import tarfile
+
+    try:
+        # Exclusion decision per directory already seen. Exclusion is
+        # prefix-monotone, so once a parent is known to be kept only the
+        # entry's own name needs checking against directory patterns.
+        dir_excluded = {}
 
         # Create tar archive with exclusions
         def filter_exclude(tarinfo):
             """Filter function to exclude files matching patterns."""
             # Get relative path
             path_str = tarinfo.name
-            base_name = os.path.basename(path_str)
+            parent, _, base_name = path_str.rpartition('/')
 
             # Never exclude files explicitly marked for inclusion
             if base_name in INCLUDE_ALWAYS:
                 return tarinfo
 
-            for pattern in EXCLUDE_PATTERNS:
-                if pattern.endswith('/'):
-                    # Directory pattern - check if directory name matches
-                    dir_name = pattern.rstrip('/')
-                    if dir_name in path_str.split('/'):
-                        return None
-                elif '*' in pattern:
-                    # Wildcard pattern
-                    import fnmatch
-                    if fnmatch.fnmatch(path_str, pattern) or fnmatch.fnmatch(base_name, pattern):
-                        return None
-                else:
-                    # Exact filename match
-                    if pattern == base_name or pattern in path_str:
-                        return None
-
-            return tarinfo
-
-        # Create the archive
-        files_added = []
-        with tarfile.open(tar_path, 'w:gz') as tar:
-            def filter_and_track(tarinfo):
-                result = filter_exclude(tarinfo)
-                if result is not None:
-                    files_added.append(tarinfo.name)
-                return result
+            parent_excluded = dir_excluded.get(parent)
+            if parent_excluded:
+                return None
+            parts = (base_name,) if parent_excluded is False else path_str.split('/')
 
-            tar.add(LOCAL_PATH, arcname='extended_mm', filter=filter_and_track)
+            excluded = is_excluded(path_str, base_name, parts)
+            if tarinfo.isdir():
+                dir_excluded[path_str] = excluded
 
-        # Get archive size
-        archive_size_mb = os.path.getsize(tar_path) / (1024 * 1024)
-        print_success(f"Archive created: {archive_size_mb:.2f} MB ({len(files_added)} files)")
+            return None if excluded else tarinfo
 
-        # List shell scripts that were included
-        sh_files = [f for f in files_added if f.endswith('.sh')]
-        if sh_files:
-            print_success(f"Shell scripts included: {', '.join([os.path.basename(f) for f in sh_files])}")
-        else:
-            print_warning("No .sh files found in archive!")
-
-        # Transfer archive to remote
-        print_info("Transferring archive to remote server...")
+        # Stream the archive to the remote server
+        files_added = []
+        previous = {} if full else load_deploy_cache()
+        shipped = {}  # Every deployable file's current state (changed or not)
+        if previous:
+            print_info("Incremental deploy: skipping files unchanged since last deploy (use --full to resend all)")
 
-        scp_cmd = [
-            "scp",
-            "-i", SSH_KEY,
-            "-o", "StrictHostKeyChecking=no",
-            "-o", "ConnectTimeout=30",
-            tar_path,
-            f"{REMOTE_USER}@{REMOTE_HOST}:/tmp/extended_mm_deploy.tar.gz"
-        ]
+        def filter_and_track(tarinfo):
+            result = filter_exclude(tarinfo)
+            if result is None:
+                return None
 
-        result = subprocess.run(scp_cmd, capture_output=True, text=True, timeout=120)
-        if result.returncode != 0:
-            print_error(f"Failed to transfer archive: {result.stderr}")
-            return False
+            # Directories are always added so tar keeps recursing
+            if tarinfo.isfile():
+                state = [tarinfo.mtime, tarinfo.size]
+                shipped[tarinfo.name] = state
+                if previous.get(tarinfo.name) == state:
+                    return None
 
-        print_success("Archive transferred successfully")
+            files_added.append(tarinfo.name)
+            return result
 
-        # Extract archive on remote server
-        print_info("Extracting archive on remote server...")
+        print_info("Streaming compressed archive to remote server...")
 
         extract_cmd = [
             "ssh",
             "-i", SSH_KEY,
-            "-o", "StrictHostKeyChecking=no",
-            "-o", "ConnectTimeout=30",
+            *SSH_OPTS,
             f"{REMOTE_USER}@{REMOTE_HOST}",
-            f"cd {REMOTE_PATH} && tar -xzf /tmp/extended_mm_deploy.tar.gz --strip-components=1 && rm /tmp/extended_mm_deploy.tar.gz"
+            f"cd {REMOTE_PATH} && tar -xzf - --strip-components=1"
         ]
 
-        result = subprocess.run(extract_cmd, capture_output=True, text=True, timeout=60)
-        if result.returncode != 0:
-            print_error(f"Failed to extract archive: {result.stderr}")
+        # ssh's stderr goes straight to the terminal, so transfer/extract errors
+        # show up as they happen. A watchdog kills the transfer once no data
+        # has been written for TRANSFER_STALL_TIMEOUT seconds; it is re-armed
+        # on every chunk, so large deploys are not capped in total time.
+        ssh = subprocess.Popen(extract_cmd, stdin=subprocess.PIPE)
+        watchdog = StallWatchdog(TRANSFER_STALL_TIMEOUT, ssh.kill)
+        watchdog.start()
+        try:
+            pigz_path = shutil.which("pigz")
+            if pigz_path:
+                # Pipe the tar through pigz (parallel gzip, same .tar.gz format)
+                print_info("Compressing with pigz (parallel gzip)")
+                pigz = subprocess.Popen([pigz_path, f"-{GZIP_COMPRESSLEVEL}"], stdin=subprocess.PIPE, stdout=ssh.stdin)
+                try:
+                    with tarfile.open(fileobj=ProgressWriter(pigz.stdin, watchdog), mode='w|') as tar:
+                        tar.add(LOCAL_PATH, arcname='extended_mm', filter=filter_and_track)
+                finally:
+                    pigz.stdin.close()
+                    pigz.wait()
+                if pigz.returncode != 0:
+                    print_error(f"pigz compression failed (exit code {pigz.returncode})")
+                    return False
+            else:
+                # Stream-mode 'w|gz' has no compresslevel before Python 3.12; wrap a GzipFile instead
+                with gzip.GzipFile(fileobj=ProgressWriter(ssh.stdin, watchdog), mode='wb', compresslevel=GZIP_COMPRESSLEVEL) as gz, \
+                        tarfile.open(fileobj=gz, mode='w|') as tar:
+                    tar.add(LOCAL_PATH, arcname='extended_mm', filter=filter_and_track)
+        except OSError:
+            # Broken pipe: ssh died (or was killed) mid-transfer; reported below
+            pass
+        finally:
+            try:
+                ssh.stdin.close()
+            except OSError:
+                pass
+            ssh.wait()
+            watchdog.cancel()
+
+        if watchdog.fired.is_set():
+            print_error(f"Transfer stalled: no data sent for {TRANSFER_STALL_TIMEOUT} seconds")
+            return False
+
+        if ssh.returncode != 0:
+            print_error(f"Failed to transfer/extract archive (ssh exit code {ssh.returncode})")
             return False
 
+        print_success(f"Archive streamed and extracted ({len(files_added)} entries, {len(shipped)} files deployed)")
+        save_deploy_cache(shipped)
+
+        # List shell scripts that are deployed
+        sh_files = [f for f in shipped if f.endswith('.sh')]
+        if sh_files:
+            print_success(f"Shell scripts included: {', '.join([os.path.basename(f) for f in sh_files])}")
+        else:
+            print_warning("No .sh files found in archive!")
+
         print_success("Deployment completed successfully")
         return True
 
     except Exception as e:
-        print_error(f"SCP deployment failed: {e}")
+        print_error(f"SSH tar deployment failed: {e}")
         return False
-    finally:
-        # Clean up local tar file
-        try:
-            if os.path.exists(tar_path):
-                os.unlink(tar_path)
-        except:
-            pass
 
 
 def display_next_steps():
@@ -558,13 +777,13 @@ def main():
     # Step 5: Deploy (auto-confirmed)
     success = False
 
-    # Use scp with tar compression (efficient single-file transfer)
+    # Stream a tar.gz over SSH (single pass, no temp files)
     # Falls back to rsync if available for incremental updates
     if check_rsync_available():
         print_info("rsync detected - using for incremental sync")
         success = deploy_with_rsync()
     else:
-        success = deploy_with_scp()
+        success = deploy_with_scp(full="--full" in sys.argv)
 
     # Step 6: Display results
     if success:
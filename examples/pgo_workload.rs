@@ -0,0 +1,117 @@
+//! Canned workload for profile-guided optimization (see build_pgo.sh)
+//!
+//! Exercises the two CPU-bound paths of the bot on deterministic synthetic data,
+//! with no network access or collected market data required:
+//! 1. Rust GARCH(1,1) fits (Gaussian and Student's t) on rolling return windows
+//! 2. SNIP-12 order signing (hashing + STARK-curve ECDSA)
+//!
+//! Usage:
+//!   cargo run --release --example pgo_workload [rounds]
+//!
+//! Example:
+//!   cargo run --release --example pgo_workload
+//!   cargo run --release --example pgo_workload 50
+
+use extended_market_maker::snip12;
+use extended_market_maker::{
+    fit_garch_11, fit_garch_11_studentt, predict_one_step, predict_one_step_studentt,
+};
+use std::env;
+use std::time::Instant;
+
+const WINDOW: usize = 2000;
+const ORDERS_PER_ROUND: u64 = 200;
+
+/// Small deterministic RNG (xorshift64*) so every profiling run is identical
+struct Rng(u64);
+
+impl Rng {
+    fn next_f64(&mut self) -> f64 {
+        self.0 ^= self.0 >> 12;
+        self.0 ^= self.0 << 25;
+        self.0 ^= self.0 >> 27;
+        (self.0.wrapping_mul(0x2545_f491_4f6c_dd1d) >> 11) as f64 / (1u64 << 53) as f64
+    }
+
+    /// Standard normal draw (Box-Muller)
+    fn normal(&mut self) -> f64 {
+        let u1 = self.next_f64().max(f64::MIN_POSITIVE);
+        let u2 = self.next_f64();
+        (-2.0 * u1.ln()).sqrt() * (2.0 * std::f64::consts::PI * u2).cos()
+    }
+}
+
+/// Simulate returns from a GARCH(1,1) with fat-tailed shocks
+fn simulate_returns(rng: &mut Rng, n: usize) -> Vec<f64> {
+    let (omega, alpha, beta) = (1e-7, 0.08, 0.9);
+    let mut h = omega / (1.0 - alpha - beta);
+    let mut returns = Vec::with_capacity(n);
+    for _ in 0..n {
+        // Occasional large shocks give the Student's t fit something to find
+        let scale = if rng.next_f64() < 0.02 { 3.0 } else { 1.0 };
+        let e = h.sqrt() * rng.normal() * scale;
+        returns.push(e);
+        h = omega + alpha * e * e + beta * h;
+    }
+    returns
+}
+
+fn main() -> Result<(), Box<dyn std::error::Error>> {
+    let rounds: usize = env::args().nth(1).map(|s| s.parse()).transpose()?.unwrap_or(20);
+
+    let mut rng = Rng(0x9e37_79b9_7f4a_7c15);
+    let returns = simulate_returns(&mut rng, WINDOW + rounds * 50);
+
+    // Key pair from the SNIP-12 test vectors
+    let public_key = "0x338f4cb92453dfb7c7764549d85ab624e6614db51b4c25c0fd63da09f07d127";
+    let private_key = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abc";
+
+    let start = Instant::now();
+    let mut sigma_sum = 0.0;
+    for round in 0..rounds {
+        // Rolling window, as the bot refits on each new batch of returns
+        let window = &returns[round * 50..round * 50 + WINDOW];
+
+        let params = fit_garch_11(window)?;
+        sigma_sum += predict_one_step(&params, window)?.sigma_next;
+
+        let params_t = fit_garch_11_studentt(window)?;
+        sigma_sum += predict_one_step_studentt(&params_t, window)?.sigma_next;
+    }
+    let garch_elapsed = start.elapsed();
+
+    let start = Instant::now();
+    let total_orders = rounds as u64 * ORDERS_PER_ROUND;
+    for i in 0..total_orders {
+        let side = if i % 2 == 0 { 1 } else { -1 };
+        snip12::sign_order(
+            "0x534f4c2d33",
+            "0x1",
+            side * (100 + (i % 7) as i128),
+            -side * 16_229_000,
+            9738,
+            226109,
+            1_234_567_890 + i,
+            1_700_000_000_000 + i * 1000,
+            public_key,
+            private_key,
+            if i % 4 == 0 { "SN_SEPOLIA" } else { "SN_MAIN" },
+        )?;
+    }
+    let signing_elapsed = start.elapsed();
+
+    println!(
+        "GARCH: {} rounds in {:.2?} (mean sigma {:.3e})",
+        rounds,
+        garch_elapsed,
+        sigma_sum / (2 * rounds.max(1)) as f64
+    );
+    println!(
+        "Signing: {} orders in {:.2?} ({:.1} us/order)",
+        total_orders,
+        signing_elapsed,
+        signing_elapsed.as_secs_f64() * 1e6 / total_orders.max(1) as f64
+    );
+
+    Ok(())
+}
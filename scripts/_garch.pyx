@@ -0,0 +1,141 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython build of the GARCH(1,1) likelihood in garch_kernel.py.
+
+Same functions and signatures as the numba kernels, for environments where
+numba's first-call compile or its LLVM dependency is unwanted. Build with:
+
+    python scripts/setup.py build_ext --inplace
+"""
+
+import numpy as np
+from cython.parallel cimport prange
+from libc.math cimport lgamma, log, logf, M_PI
+
+# Keep in sync with garch_kernel.py (DEF is deprecated in Cython 3)
+cdef enum:
+    DIST_STUDENTST = 1
+
+cdef double INFEASIBLE = 1e10
+
+
+cdef double _neg_loglik(const double[::1] params, const double[::1] returns,
+                        int flag, double backcast_value) noexcept nogil:
+    cdef double mu = params[0]
+    cdef double omega = params[1]
+    cdef double alpha = params[2]
+    cdef double beta = params[3]
+    cdef double nu = 0.0
+    cdef double const, h, e, e_prev
+    cdef double total = 0.0
+    cdef Py_ssize_t t
+
+    if omega <= 0.0 or alpha < 0.0 or beta < 0.0 or alpha + beta >= 1.0:
+        return INFEASIBLE
+
+    if flag == DIST_STUDENTST:
+        nu = params[4]
+        if nu <= 2.0:
+            return INFEASIBLE
+        const = lgamma((nu + 1.0) / 2.0) - lgamma(nu / 2.0) - 0.5 * log(M_PI * (nu - 2.0))
+    else:
+        const = -0.5 * log(2.0 * M_PI)
+
+    h = omega + (alpha + beta) * backcast_value
+    for t in range(returns.shape[0]):
+        if t > 0:
+            e_prev = returns[t - 1] - mu
+            h = omega + alpha * e_prev * e_prev + beta * h
+        if h <= 0.0:
+            return INFEASIBLE
+
+        e = returns[t] - mu
+        if flag == DIST_STUDENTST:
+            total += const - 0.5 * log(h) - (nu + 1.0) / 2.0 * log(1.0 + e * e / (h * (nu - 2.0)))
+        else:
+            total += const - 0.5 * (log(h) + e * e / h)
+
+    return -total
+
+
+cdef double _neg_loglik_f32(const double[::1] params, const float[::1] returns,
+                            int flag, double backcast_value) noexcept nogil:
+    cdef double mu = params[0]
+    cdef double omega = params[1]
+    cdef double alpha = params[2]
+    cdef double beta = params[3]
+    cdef double nu, const, h
+    cdef float mu32, half_nu1 = 0.0, inv_nu2 = 0.0
+    cdef float e, h32, e_prev = 0.0
+    cdef double total = 0.0
+    cdef Py_ssize_t t
+
+    if omega <= 0.0 or alpha < 0.0 or beta < 0.0 or alpha + beta >= 1.0:
+        return INFEASIBLE
+
+    if flag == DIST_STUDENTST:
+        nu = params[4]
+        if nu <= 2.0:
+            return INFEASIBLE
+        const = lgamma((nu + 1.0) / 2.0) - lgamma(nu / 2.0) - 0.5 * log(M_PI * (nu - 2.0))
+        half_nu1 = <float>((nu + 1.0) / 2.0)
+        inv_nu2 = <float>(1.0 / (nu - 2.0))
+    else:
+        const = -0.5 * log(2.0 * M_PI)
+
+    mu32 = <float>mu
+    h = omega + (alpha + beta) * backcast_value
+    for t in range(returns.shape[0]):
+        if t > 0:
+            h = omega + alpha * <double>(e_prev * e_prev) + beta * h
+        if h <= 0.0:
+            return INFEASIBLE
+
+        e = returns[t] - mu32
+        h32 = <float>h
+        if flag == DIST_STUDENTST:
+            total += -0.5 * logf(h32) - half_nu1 * logf(1.0 + e * e * inv_nu2 / h32)
+        else:
+            total += -0.5 * (logf(h32) + e * e / h32)
+        e_prev = e
+
+    return -(total + const * returns.shape[0])
+
+
+def neg_loglik(const double[::1] params, const double[::1] returns, int flag, double backcast_value):
+    """Negative log-likelihood of a constant-mean GARCH(1,1)."""
+    return _neg_loglik(params, returns, flag, backcast_value)
+
+
+def neg_loglik_f32(const double[::1] params, const float[::1] returns, int flag, double backcast_value):
+    """neg_loglik for float32 returns, with the per-observation terms in float32."""
+    return _neg_loglik_f32(params, returns, flag, backcast_value)
+
+
+def batch_neg_loglik(const double[:, ::1] params_mat, const float[::1] returns,
+                     int flag, double backcast_value):
+    """neg_loglik_f32 for every row of params_mat, evaluated in parallel (OpenMP)."""
+    cdef Py_ssize_t i
+    out = np.empty(params_mat.shape[0])
+    cdef double[::1] out_view = out
+
+    for i in prange(params_mat.shape[0], nogil=True):
+        out_view[i] = _neg_loglik_f32(params_mat[i], returns, flag, backcast_value)
+
+    return out
+
+
+def last_variance(const double[::1] params, const double[::1] returns, double backcast_value):
+    """Conditional variance h_T of the final observation."""
+    cdef double mu = params[0]
+    cdef double omega = params[1]
+    cdef double alpha = params[2]
+    cdef double beta = params[3]
+    cdef double h = omega + (alpha + beta) * backcast_value
+    cdef double e_prev
+    cdef Py_ssize_t t
+
+    for t in range(1, returns.shape[0]):
+        e_prev = returns[t - 1] - mu
+        h = omega + alpha * e_prev * e_prev + beta * h
+    return h
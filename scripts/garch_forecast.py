@@ -6,23 +6,404 @@ This script fits a GARCH(1,1) model to returns data and provides
 a one-step-ahead volatility forecast.
 
 Usage:
-    python scripts/garch_forecast.py <returns_file> [distribution]
+    python scripts/garch_forecast.py <returns_file> [distribution] [mu omega alpha beta]
+    python scripts/garch_forecast.py --forecast-only <returns_file> [distribution] mu omega alpha beta
+    python scripts/garch_forecast.py --server
 
 Where:
     returns_file is a CSV with one return per line.
     distribution is optional: 'studentst' (default) or 'normal'
+
+With --forecast-only the given parameters are trusted and only the variance
+recursion is run to produce the one-step-ahead forecast (no fitting).
+
+In --server mode the script stays alive and reads one JSON request per line
+from stdin ({"returns": [...], "distribution": ..., "starting_values": [...]})
+and writes one JSON result per line to stdout, so callers pay the interpreter
+start-up and arch import only once.
 """
 
+import os
 import sys
+import functools
+import hashlib
+import importlib.util
+import tempfile
 import numpy as np
 import json
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 # Suppress convergence warnings to avoid breaking JSON output
 warnings.filterwarnings('ignore')
 
+# On-disk cache of successful fits, keyed by input (see fit_cache_key)
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'garch_forecast')
+CACHE_MAX_FILES = 1024
+# Bump when the search or the result format changes, to orphan older entries
+CACHE_VERSION = 'garch-fit-v3'
+
+# Multi-start search sizes: full fits for the arch path (run in rounds so the
+# process pool has independent work), and candidates ranked / refined by the
+# compiled likelihood when garch_kernel has one (Cython or numba)
+NUM_TRIALS = 32
+ROUND_SIZE = 8
+NUM_CANDIDATES = 1000
+TOP_K = 5
+
+# Per-process state used by multi-start trial workers (see _init_trial_worker):
+# the arch model, or (returns, distribution) when the compiled kernel is used
+_trial_model = None
+_trial_data = None
+
+# arch models by (sha256 of returns, distribution), so a server refitting the
+# same window (rolling backtests) skips arch's validation and setup. Models
+# only hold the data; fits never modify them
+MODEL_CACHE_SIZE = 8
+_MODEL_CACHE = {}
+
+
+@functools.lru_cache(maxsize=None)
+def fit_backend():
+    """
+    Name of the multi-start search backend: 'cython', 'numba' or 'arch'.
+
+    Found from what is importable rather than by importing garch_kernel, so
+    cache hits and forecast-only requests never pay for loading numba.
+    """
+    if importlib.util.find_spec('_garch') is not None:
+        return 'cython'
+    if importlib.util.find_spec('numba') is not None:
+        return 'numba'
+    return 'arch'
+
+
+def fit_cache_key(returns, distribution, starting_values, seed=None):
+    """
+    SHA-256 over the returns bytes, distribution, starting values and seed,
+    plus everything else that shapes the fit: the search backend, its
+    constants and CACHE_VERSION.
+    """
+    sv = None if starting_values is None else [float(x) for x in starting_values]
+    search = (NUM_TRIALS, ROUND_SIZE, NUM_CANDIDATES, TOP_K)
+    h = hashlib.sha256(returns.tobytes())
+    h.update(distribution.encode())
+    h.update(repr(sv).encode())
+    h.update(repr(seed).encode())
+    h.update(fit_backend().encode())
+    h.update(repr(search).encode())
+    h.update(CACHE_VERSION.encode())
+    return h.hexdigest()
+
+
+def load_cached_fit(key):
+    """Return the cached result dict for key, or None on a miss."""
+    path = os.path.join(CACHE_DIR, f'{key}.json')
+    try:
+        with open(path, 'r') as f:
+            cached = json.load(f)
+        # Refresh mtime so eviction drops the least recently used entries
+        os.utime(path)
+        return cached
+    except (OSError, ValueError):
+        return None
+
+
+def store_cached_fit(key, result_dict):
+    """Atomically write result_dict to the cache and evict the oldest entries."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(result_dict, f)
+            os.replace(tmp_path, os.path.join(CACHE_DIR, f'{key}.json'))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        with os.scandir(CACHE_DIR) as it:
+            entries = [e for e in it if e.name.endswith('.json')]
+        if len(entries) > CACHE_MAX_FILES:
+            entries.sort(key=lambda e: e.stat().st_mtime)
+            for entry in entries[:len(entries) - CACHE_MAX_FILES]:
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        # Caching is best effort; never fail a forecast because of it
+        pass
+
+
+def build_model(returns, distribution):
+    """Build (or reuse) the GARCH(1,1) constant-mean model used for every fit."""
+    from arch import arch_model
+
+    returns = np.ascontiguousarray(returns, dtype=np.float64)
+    key = (hashlib.sha256(returns.tobytes()).hexdigest(), distribution)
+    model = _MODEL_CACHE.pop(key, None)
+
+    if model is None:
+        model = arch_model(
+            returns.copy(),  # the model keeps a reference; callers may reuse their buffer
+            mean='Constant',
+            vol='GARCH',
+            p=1,
+            q=1,
+            dist=distribution,
+            rescale=False
+        )
+        while len(_MODEL_CACHE) >= MODEL_CACHE_SIZE:
+            del _MODEL_CACHE[next(iter(_MODEL_CACHE))]
+
+    # Reinsert so dict order stays least- to most-recently used
+    _MODEL_CACHE[key] = model
+    return model
+
+
+def summarize_fit(result):
+    """
+    Extract the JSON-serializable fields of a fitted arch result.
+
+    Kept small so multi-start workers can send it back cheaply instead of
+    pickling the full result object.
+    """
+    # Extract parameters
+    # result.params gives us: ['mu', 'omega', 'alpha[1]', 'beta[1]', 'nu']
+    # where 'nu' is the degrees of freedom for Student's t distribution
+    # rescale=True handles scaling automatically, so parameters are in original scale
+    params = result.params
+    mu = params['mu']
+    omega = params['omega']
+    alpha = params['alpha[1]']
+    beta = params['beta[1]']
+    nu = params['nu'] if 'nu' in params else None  # Degrees of freedom
+
+    # One-step-ahead forecast σ²_{t+1|t} = omega + alpha * e_T^2 + beta * h_T,
+    # computed directly: result.forecast() builds pandas frames for one number
+    e_last = float(np.asarray(result.resid)[-1])
+    h_last = float(np.asarray(result.conditional_volatility)[-1]) ** 2
+    var_next = omega + alpha * e_last * e_last + beta * h_last
+    sigma_next = np.sqrt(var_next)
+
+    summary = {
+        'mu': float(mu),
+        'omega': float(omega),
+        'alpha': float(alpha),
+        'beta': float(beta),
+        'sigma_next': float(sigma_next),
+        'var_next': float(var_next),
+        'log_likelihood': float(result.loglikelihood),
+        'aic': float(result.aic),
+        'bic': float(result.bic),
+        'convergence_flag': int(result.convergence_flag) if hasattr(result, 'convergence_flag') else -1,
+        'num_iterations': int(result.iterations) if hasattr(result, 'iterations') else -1,
+    }
+
+    # Add degrees of freedom if using Student's t
+    if nu is not None:
+        summary['nu'] = float(nu)
+
+    return summary
+
+
+def _init_trial_worker(returns, distribution):
+    """Build the model once per worker process; trials only change starting values."""
+    global _trial_model, _trial_data
+    import garch_kernel
+    warnings.filterwarnings('ignore')
+    if garch_kernel.HAVE_KERNEL:
+        _trial_data = (np.ascontiguousarray(returns, dtype=np.float64), distribution)
+    else:
+        _trial_data = None
+        _trial_model = build_model(returns, distribution)
+
+
+def _fit_shared_trial(returns, distribution, sv):
+    """
+    _fit_one_trial for a pool shared across requests (see serve()).
 
-def fit_garch_and_forecast(returns, distribution='studentst', starting_values=None):
+    The window travels with each trial; build_model's cache keeps the worker
+    from rebuilding the model for every trial of the same request.
+    """
+    _init_trial_worker(returns, distribution)
+    return _fit_one_trial(sv)
+
+
+def _fit_one_trial(sv):
+    """
+    Fit the worker's model from one set of starting values.
+
+    Returns the summarize_fit() dict, or None if the fit failed.
+    """
+    try:
+        if _trial_data is not None:
+            # Compiled likelihood + L-BFGS-B, much cheaper than arch's generic fit
+            import garch_kernel
+            returns, distribution = _trial_data
+            return garch_kernel.fit(returns, sv, distribution)
+
+        trial_result = _trial_model.fit(
+            disp='off',
+            show_warning=False,
+            update_freq=0,
+            starting_values=sv,
+            options={'ftol': 1e-6, 'maxiter': 20000}
+        )
+        return summarize_fit(trial_result)
+    except Exception:
+        # If this trial fails, skip it
+        return None
+
+
+def forecast_garch(returns, mu, omega, alpha, beta):
+    """
+    One-step-ahead forecast from already-estimated GARCH(1,1) parameters.
+
+    Runs h_t = omega + alpha * e_{t-1}^2 + beta * h_{t-1} over the window,
+    starting from the unconditional variance (the sample variance if the
+    parameters are not stationary), and returns sigma^2_{T+1|T}.
+    """
+    persistence = alpha + beta
+    if persistence < 1.0:
+        h = omega / (1.0 - persistence)
+    else:
+        h = float(np.var(returns))
+
+    for e in (returns - mu).tolist():
+        h = omega + alpha * e * e + beta * h
+
+    return h
+
+
+def _perturb(center, steps, lower, upper):
+    """
+    Starting values for each row of Gaussian steps taken from center.
+
+    Steps on mu and omega are log-multipliers; alpha, beta (and nu) step
+    additively. Results are clipped to the search bounds.
+    """
+    steps = np.clip(steps, lower - upper, upper - lower)
+
+    sv = np.tile(center, (steps.shape[0], 1))
+    sv[:, 0] *= np.exp(np.clip(steps[:, 0], lower[0], upper[0]))
+    sv[:, 1] *= np.exp(np.clip(steps[:, 1], lower[1], upper[1]))
+    sv[:, 2:] += steps[:, 2:]
+
+    # Ensure parameters stay within valid bounds (in place: sv is the only copy)
+    np.maximum(sv[:, 1], 1e-8, out=sv[:, 1])  # omega must be positive
+    np.clip(sv[:, 2:], lower[2:], upper[2:], out=sv[:, 2:])  # alpha, beta (and nu)
+
+    return sv
+
+
+def _decay(num_trials):
+    """Per-trial step scale: half the permissible range, shrinking by 0.9 per trial."""
+    return 0.5 * 0.9 ** np.arange(num_trials)
+
+
+def _round_search(returns, distribution, center, lower, upper, n_jobs, rng, executor=None):
+    """
+    Decreasing-step Gaussian random search over full fits.
+
+    The step starts at half the permissible range and shrinks by 0.9 per
+    trial, so early rounds sample globally and later rounds refine around the
+    best fit found so far instead of trying wild points that never converge.
+    Trials within a round are independent and run across worker processes.
+    All NUM_TRIALS trials always run: arch's fits are noisy enough that a
+    late round still finds a better optimum after rounds without improvement.
+
+    A long-lived caller can pass its own executor, which is used instead of
+    starting (and tearing down) a pool for this search.
+    """
+    best_sv = center.copy()
+    # All randomness is drawn up front; rounds only rescale and recenter it
+    steps = rng.standard_normal((NUM_TRIALS, center.shape[0]))
+    steps *= _decay(NUM_TRIALS)[:, None] * (upper - lower)
+
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+
+    own_executor = None
+    if executor is not None:
+        trial_fn = functools.partial(_fit_shared_trial, returns, distribution)
+    elif n_jobs > 1:
+        trial_fn = _fit_one_trial
+        executor = own_executor = ProcessPoolExecutor(
+            max_workers=min(n_jobs, ROUND_SIZE),
+            initializer=_init_trial_worker,
+            initargs=(returns, distribution)
+        )
+    else:
+        trial_fn = _fit_one_trial
+        _init_trial_worker(returns, distribution)
+
+    summary = None
+    try:
+        for round_start in range(0, NUM_TRIALS, ROUND_SIZE):
+            trial_starts = _perturb(best_sv, steps[round_start:round_start + ROUND_SIZE], lower, upper)
+
+            if executor is not None:
+                round_summaries = executor.map(trial_fn, trial_starts)
+            else:
+                round_summaries = map(trial_fn, trial_starts)
+
+            # Keep the best likelihood and recenter the search on its fit
+            for trial_summary in round_summaries:
+                if trial_summary is None:
+                    continue
+                if summary is None or trial_summary['log_likelihood'] > summary['log_likelihood']:
+                    summary = trial_summary
+
+            if summary is not None:
+                best_sv[:4] = [summary['mu'], summary['omega'], summary['alpha'], summary['beta']]
+                if 'nu' in summary:
+                    best_sv[4] = np.clip(summary['nu'], lower[4], upper[4])
+    finally:
+        if own_executor is not None:
+            own_executor.shutdown()
+
+    return summary
+
+
+def _ranked_search(returns, distribution, center, lower, upper, rng):
+    """
+    Rank many random starts with one batched likelihood call, then fully fit
+    only the best few.
+
+    Candidates follow the same decreasing-step schedule as _round_search,
+    stretched over NUM_CANDIDATES draws around the caller's starting values.
+    """
+    import garch_kernel
+
+    returns = np.ascontiguousarray(returns, dtype=np.float64)
+    steps = rng.standard_normal((NUM_CANDIDATES, center.shape[0]))
+    steps *= _decay(NUM_TRIALS)[np.arange(NUM_CANDIDATES) * NUM_TRIALS // NUM_CANDIDATES, None] * (upper - lower)
+    candidates = _perturb(center, steps, lower, upper)
+    # Always consider the caller's own starting values
+    candidates[0] = _perturb(center, np.zeros((1, center.shape[0])), lower, upper)[0]
+
+    # Ranking only needs the order of the likelihoods, so it runs on float32
+    # returns; the fits below are float64
+    nll = garch_kernel.batch_neg_loglik(
+        candidates, returns.astype(np.float32), garch_kernel.dist_flag(distribution),
+        garch_kernel.backcast(returns)
+    )
+
+    summary = None
+    for idx in np.argsort(nll)[:TOP_K]:
+        trial_summary = garch_kernel.fit(returns, candidates[idx], distribution)
+        if trial_summary is None:
+            continue
+        if summary is None or trial_summary['log_likelihood'] > summary['log_likelihood']:
+            summary = trial_summary
+
+    return summary
+
+
+def fit_garch_and_forecast(returns, distribution='studentst', starting_values=None, n_jobs=None,
+                           use_cache=True, seed=None, forecast_only=False, executor=None):
     """
     Fit GARCH(1,1) model and return one-step-ahead forecast.
 
@@ -32,6 +413,21 @@ def fit_garch_and_forecast(returns, distribution='studentst', starting_values=No
         Log returns data
     distribution : str
         Distribution to use: 'studentst' or 'normal'
+    starting_values : list, optional
+        [mu, omega, alpha, beta] to perturb for the multi-start search
+    n_jobs : int, optional
+        Worker processes for the multi-start trials (default: os.cpu_count()).
+        1 runs the trials in-process.
+    executor : concurrent.futures.Executor, optional
+        Reuse this pool for the multi-start trials instead of starting one
+        per call (ignores n_jobs)
+    use_cache : bool
+        Reuse a previous fit of identical inputs from CACHE_DIR (default: True)
+    seed : int, optional
+        Seed for the multi-start search (default: fresh OS entropy)
+    forecast_only : bool
+        Trust starting_values as the fitted parameters and only run the
+        variance recursion for the forecast (no fitting)
 
     Returns
     -------
@@ -46,13 +442,6 @@ def fit_garch_and_forecast(returns, distribution='studentst', starting_values=No
         - message: error message if failed
     """
     try:
-        # Import arch here to catch import errors
-        from arch import arch_model
-        from arch.univariate.base import ConvergenceWarning
-
-        # Suppress convergence warnings specifically
-        warnings.filterwarnings('ignore', category=ConvergenceWarning)
-
         returns = np.asarray(returns, dtype=np.float64)
 
         if len(returns) < 3:
@@ -68,123 +457,79 @@ def fit_garch_and_forecast(returns, distribution='studentst', starting_values=No
                 'message': 'Returns contain non-finite values (NaN or Inf)'
             }
 
-        # Fit GARCH(1,1) model with constant mean
-        model = arch_model(
-            returns,
-            mean='Constant',
-            vol='GARCH',
-            p=1,
-            q=1,
-            dist=distribution,
-            rescale=False
-        )
+        if forecast_only:
+            if starting_values is None:
+                return {
+                    'success': False,
+                    'message': 'forecast_only requires starting values [mu, omega, alpha, beta]'
+                }
+            mu, omega, alpha, beta = (float(x) for x in starting_values[:4])
+            var_next = forecast_garch(returns, mu, omega, alpha, beta)
+            return {
+                'success': True,
+                'mu': mu,
+                'omega': omega,
+                'alpha': alpha,
+                'beta': beta,
+                'sigma_next': float(np.sqrt(var_next)),
+                'var_next': float(var_next),
+            }
+
+        # Identical window, distribution, starting values, seed and search: skip fitting
+        if use_cache:
+            cache_key = fit_cache_key(returns, distribution, starting_values, seed)
+            cached = load_cached_fit(cache_key)
+            if cached is not None:
+                return cached
+
+        # Import arch and the compiled kernel here (after the cache check, both
+        # are slow: numba alone is ~0.3 s) to catch import errors
+        from arch.univariate.base import ConvergenceWarning
+        import garch_kernel
+
+        # Suppress convergence warnings specifically
+        warnings.filterwarnings('ignore', category=ConvergenceWarning)
 
         # Fit model with starting values if provided
         try:
-            # Build fit parameters
-            fit_kwargs = {
-                'disp': 'off',
-                'show_warning': False,
-                'update_freq': 0
-            }
-
             if starting_values is not None:
-                # Try multiple random perturbations and pick the best likelihood
-                num_trials = 100
-                best_result = None
-                best_loglik = -np.inf
-
-                for trial in range(num_trials):
-                    # starting_values = [mu, omega, alpha, beta]
-                    # Add random perturbation to explore parameter space
-                    sv = np.array(starting_values, dtype=float)
-
-                    # Multiply each parameter by random factor between 0.125x and 8.0x
-                    np.random.seed(None)  # Use different seed each time
-                    multiplier = np.random.uniform(0.125, 8.0, size=len(sv))
-                    sv = sv * multiplier
-
-                    # Ensure parameters stay within valid bounds
-                    sv[1] = max(sv[1], 1e-8)  # omega must be positive
-                    sv[2] = np.clip(sv[2], 0.01, 0.99)  # alpha between 0.01 and 0.99
-                    sv[3] = np.clip(sv[3], 0.01, 0.99)  # beta between 0.01 and 0.99
-
-                    if distribution == 'studentst':
-                        # Add degrees of freedom with randomization (between 3 and 20)
-                        nu_random = np.random.uniform(3.0, 20.0)
-                        sv = np.append(sv, nu_random)
-
-                    trial_fit_kwargs = fit_kwargs.copy()
-                    trial_fit_kwargs['starting_values'] = sv
-                    trial_fit_kwargs['options'] = {'ftol': 1e-6, 'maxiter': 20000}
-
-                    try:
-                        trial_result = model.fit(**trial_fit_kwargs)
-                        loglik = trial_result.loglikelihood
-
-                        # Keep the best result
-                        if loglik > best_loglik:
-                            best_loglik = loglik
-                            best_result = trial_result
-                    except:
-                        # If this trial fails, skip it
-                        continue
-
-                if best_result is None:
+                # Search space: [log-multiplier of mu, log-multiplier of omega, alpha, beta, nu]
+                # mu and omega are scale-dependent, so they are searched as
+                # multiplicative factors in [0.125, 8] around the current center
+                lower = np.array([np.log(0.125), np.log(0.125), 0.01, 0.01, 3.0])
+                upper = np.array([np.log(8.0), np.log(8.0), 0.99, 0.99, 20.0])
+                if distribution != 'studentst':
+                    lower, upper = lower[:4], upper[:4]
+
+                # starting_values = [mu, omega, alpha, beta]; nu starts mid-range
+                center = np.empty(lower.shape[0])
+                center[:4] = starting_values[:4]
+                if distribution == 'studentst':
+                    center[4] = 0.5 * (lower[4] + upper[4])
+
+                rng = np.random.default_rng(seed)
+                if garch_kernel.HAVE_KERNEL:
+                    summary = _ranked_search(returns, distribution, center, lower, upper, rng)
+                else:
+                    summary = _round_search(returns, distribution, center, lower, upper, n_jobs, rng,
+                                            executor)
+
+                if summary is None:
                     raise Exception("All trials failed to converge")
-
-                result = best_result
             else:
                 # No starting values provided, use defaults
-                result = model.fit(**fit_kwargs)
+                model = build_model(returns, distribution)
+                result = model.fit(disp='off', show_warning=False, update_freq=0)
+                summary = summarize_fit(result)
         except Exception as e:
             return {
                 'success': False,
                 'message': f'Model fit failed: {str(e)}'
             }
 
-        # Extract parameters
-        # result.params gives us: ['mu', 'omega', 'alpha[1]', 'beta[1]', 'nu']
-        # where 'nu' is the degrees of freedom for Student's t distribution
-        # rescale=True handles scaling automatically, so parameters are in original scale
-        params = result.params
-        mu = params['mu']
-        omega = params['omega']
-        alpha = params['alpha[1]']
-        beta = params['beta[1]']
-        nu = params['nu'] if 'nu' in params else None  # Degrees of freedom
-
-        # Get one-step-ahead forecast
-        # forecast() returns ForecastResult with:
-        #   - mean: forecasted mean
-        #   - variance: forecasted variance
-        #   - residual_variance: forecasted conditional variance
-        forecast = result.forecast(horizon=1, start=None, reindex=False)
-
-        # Get the forecasted variance (this is σ²_{t+1|t})
-        # The variance attribute contains conditional variance forecasts
-        # rescale=True handles scaling automatically, so forecast is in original scale
-        var_next = float(forecast.variance.iloc[-1, 0])
-        sigma_next = np.sqrt(var_next)
-
-        result_dict = {
-            'success': True,
-            'mu': float(mu),
-            'omega': float(omega),
-            'alpha': float(alpha),
-            'beta': float(beta),
-            'sigma_next': float(sigma_next),
-            'var_next': float(var_next),
-            'log_likelihood': float(result.loglikelihood),
-            'aic': float(result.aic),
-            'bic': float(result.bic),
-            'convergence_flag': int(result.convergence_flag) if hasattr(result, 'convergence_flag') else -1,
-            'num_iterations': int(result.iterations) if hasattr(result, 'iterations') else -1,
-        }
-
-        # Add degrees of freedom if using Student's t
-        if nu is not None:
-            result_dict['nu'] = float(nu)
+        result_dict = {'success': True, **summary}
+        if use_cache:
+            store_cached_fit(cache_key, result_dict)
 
         return result_dict
 
@@ -200,32 +545,110 @@ def fit_garch_and_forecast(returns, distribution='studentst', starting_values=No
         }
 
 
+def load_returns(path):
+    """
+    Read one return per line.
+
+    np.fromfile's C parser is much faster than np.loadtxt on long histories.
+    It cannot skip comments or handle delimited columns, so anything it does
+    not read to the end falls back to np.loadtxt.
+    """
+    try:
+        with warnings.catch_warnings():
+            # Older numpy only warns (and truncates) on unparseable input
+            warnings.simplefilter('error', DeprecationWarning)
+            returns = np.fromfile(path, sep='\n', dtype=np.float64)
+        if returns.size > 0:
+            return returns
+    except (ValueError, DeprecationWarning):
+        pass
+    return np.loadtxt(path)
+
+
+def serve():
+    """Answer line-delimited JSON fit requests from stdin until EOF."""
+    # Without a compiled kernel, trials are arch fits spread over one pool that
+    # lives as long as the server, so requests don't pay for worker start-up
+    # and arch imports. (The kernel path fits in-process; forking after its
+    # threads have started is also unsafe.)
+    import garch_kernel
+
+    executor = None
+    n_jobs = os.cpu_count() or 1
+    if not garch_kernel.HAVE_KERNEL and n_jobs > 1:
+        executor = ProcessPoolExecutor(max_workers=min(n_jobs, ROUND_SIZE))
+
+    # Warm up: import arch and run one small multi-start fit so the first real
+    # request does not pay for the imports or for loading the compiled kernel
+    warmup = np.random.default_rng(0).standard_normal(256) * 1e-3
+    fit_garch_and_forecast(warmup, 'normal', [0.0, 1e-7, 0.05, 0.9], n_jobs=1, use_cache=False,
+                           executor=executor)
+
+    try:
+        _serve_requests(executor)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def _serve_requests(executor):
+    """Read requests from stdin and write one JSON result per line."""
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+            result = fit_garch_and_forecast(
+                request['returns'],
+                request.get('distribution', 'studentst'),
+                request.get('starting_values'),
+                forecast_only=request.get('forecast_only', False),
+                executor=executor,
+            )
+        except Exception as e:
+            result = {
+                'success': False,
+                'message': f'Invalid request: {str(e)}'
+            }
+        sys.stdout.write(json.dumps(result) + '\n')
+        sys.stdout.flush()
+
+
 def main():
     """Command-line interface."""
-    if len(sys.argv) < 2:
-        print("Usage: python scripts/garch_forecast.py <returns_file> [distribution] [mu omega alpha beta]")
+    if '--server' in sys.argv:
+        serve()
+        return
+
+    forecast_only = '--forecast-only' in sys.argv
+    argv = [arg for arg in sys.argv if arg != '--forecast-only']
+
+    if len(argv) < 2:
+        print("Usage: python scripts/garch_forecast.py [--forecast-only] <returns_file> [distribution] [mu omega alpha beta]")
         print("\nWhere:")
         print("  returns_file is a CSV/text file with one return per line")
         print("  distribution is optional: 'studentst' (default) or 'normal'")
         print("  mu omega alpha beta are optional starting values from Rust GARCH fit")
+        print("  --forecast-only uses mu omega alpha beta as-is and skips fitting")
         sys.exit(1)
 
-    returns_file = sys.argv[1]
+    returns_file = argv[1]
     distribution = 'studentst'
     starting_values = None
 
     # Parse distribution (if provided and not a number)
-    if len(sys.argv) >= 3:
+    if len(argv) >= 3:
         try:
-            float(sys.argv[2])  # Check if it's a number (starting value)
+            float(argv[2])  # Check if it's a number (starting value)
             # It's a number, so no distribution was specified
             distribution = 'studentst'
-            starting_values = [float(x) for x in sys.argv[2:6]] if len(sys.argv) >= 6 else None
+            starting_values = [float(x) for x in argv[2:6]] if len(argv) >= 6 else None
         except ValueError:
             # It's a string (distribution)
-            distribution = sys.argv[2]
-            if len(sys.argv) >= 7:
-                starting_values = [float(x) for x in sys.argv[3:7]]
+            distribution = argv[2]
+            if len(argv) >= 7:
+                starting_values = [float(x) for x in argv[3:7]]
 
     # Validate distribution
     if distribution not in ['studentst', 'normal']:
@@ -235,13 +658,13 @@ def main():
 
     # Load returns from file
     try:
-        returns = np.loadtxt(returns_file)
+        returns = load_returns(returns_file)
     except Exception as e:
         print(f"Error loading returns file: {e}", file=sys.stderr)
         sys.exit(1)
 
     # Fit GARCH and forecast
-    result = fit_garch_and_forecast(returns, distribution, starting_values)
+    result = fit_garch_and_forecast(returns, distribution, starting_values, forecast_only=forecast_only)
 
     # Output results as JSON
     print(json.dumps(result, indent=2))
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Compiled GARCH(1,1) likelihood and maximum-likelihood fit.
+
+A hand-rolled replacement for arch_model(mean='Constant', vol='GARCH', p=1, q=1)
+used by garch_forecast.py's multi-start search. The negative log-likelihood is
+a single pass over the returns, compiled with numba when it is installed, and
+minimized with scipy's L-BFGS-B.
+
+The recursion and likelihoods follow arch so fits are comparable:
+    h_0 = omega + (alpha + beta) * backcast
+    h_t = omega + alpha * e_{t-1}^2 + beta * h_{t-1}
+where backcast is arch's exponentially weighted mean of the first 75 squared
+demeaned returns.
+
+The kernels come from the Cython extension _garch (see setup.py) when it has
+been built, otherwise from numba. Both are optional: without either,
+HAVE_KERNEL is False and garch_forecast.py keeps using arch, since the
+pure-Python loop would be slower than arch.
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in decorator when numba is not installed."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Distribution flags accepted by neg_loglik
+DIST_NORMAL = 0
+DIST_STUDENTST = 1
+
+# Returned for infeasible parameters (non-stationary, non-positive variance)
+INFEASIBLE = 1e10
+
+
+def dist_flag(distribution):
+    """Map an arch distribution name to the kernel's flag."""
+    if distribution == 'studentst':
+        return DIST_STUDENTST
+    if distribution == 'normal':
+        return DIST_NORMAL
+    raise ValueError(f"Unsupported distribution '{distribution}'")
+
+
+def backcast(returns):
+    """arch's starting variance: weighted mean of early squared demeaned returns."""
+    resids = returns - returns.mean()
+    tau = min(75, resids.shape[0])
+    w = 0.94 ** np.arange(tau)
+    w = w / w.sum()
+    return float(np.sum(resids[:tau] ** 2.0 * w))
+
+
+@njit(cache=True, fastmath=True)
+def neg_loglik(params, returns, flag, backcast_value):
+    """
+    Negative log-likelihood of a constant-mean GARCH(1,1).
+
+    params is [mu, omega, alpha, beta] or [mu, omega, alpha, beta, nu]
+    for Student's t.
+    """
+    mu = params[0]
+    omega = params[1]
+    alpha = params[2]
+    beta = params[3]
+
+    if omega <= 0.0 or alpha < 0.0 or beta < 0.0 or alpha + beta >= 1.0:
+        return INFEASIBLE
+
+    if flag == DIST_STUDENTST:
+        nu = params[4]
+        if nu <= 2.0:
+            return INFEASIBLE
+        const = (math.lgamma((nu + 1.0) / 2.0) - math.lgamma(nu / 2.0)
+                 - 0.5 * math.log(math.pi * (nu - 2.0)))
+    else:
+        nu = 0.0
+        const = -0.5 * math.log(2.0 * math.pi)
+
+    h = omega + (alpha + beta) * backcast_value
+    total = 0.0
+    for t in range(returns.shape[0]):
+        if t > 0:
+            e_prev = returns[t - 1] - mu
+            h = omega + alpha * e_prev * e_prev + beta * h
+        if h <= 0.0:
+            return INFEASIBLE
+
+        e = returns[t] - mu
+        if flag == DIST_STUDENTST:
+            total += const - 0.5 * math.log(h) - (nu + 1.0) / 2.0 * math.log(1.0 + e * e / (h * (nu - 2.0)))
+        else:
+            total += const - 0.5 * (math.log(h) + e * e / h)
+
+    return -total
+
+
+@njit(cache=True, fastmath=True)
+def neg_loglik_f32(params, returns, flag, backcast_value):
+    """
+    neg_loglik for float32 returns, with the per-observation terms in float32.
+
+    The variance recursion h and the running sum stay in float64. Accurate to
+    a few 1e-4 on the total, which is plenty to rank starting points.
+    """
+    mu = params[0]
+    omega = params[1]
+    alpha = params[2]
+    beta = params[3]
+
+    if omega <= 0.0 or alpha < 0.0 or beta < 0.0 or alpha + beta >= 1.0:
+        return INFEASIBLE
+
+    if flag == DIST_STUDENTST:
+        nu = params[4]
+        if nu <= 2.0:
+            return INFEASIBLE
+        const = (math.lgamma((nu + 1.0) / 2.0) - math.lgamma(nu / 2.0)
+                 - 0.5 * math.log(math.pi * (nu - 2.0)))
+        half_nu1 = np.float32((nu + 1.0) / 2.0)
+        inv_nu2 = np.float32(1.0 / (nu - 2.0))
+    else:
+        const = -0.5 * math.log(2.0 * math.pi)
+        half_nu1 = np.float32(0.0)
+        inv_nu2 = np.float32(0.0)
+
+    mu32 = np.float32(mu)
+    half = np.float32(0.5)
+    one = np.float32(1.0)
+
+    h = omega + (alpha + beta) * backcast_value
+    total = 0.0
+    e_prev = np.float32(0.0)
+    for t in range(returns.shape[0]):
+        if t > 0:
+            h = omega + alpha * float(e_prev * e_prev) + beta * h
+        if h <= 0.0:
+            return INFEASIBLE
+
+        e = returns[t] - mu32
+        h32 = np.float32(h)
+        if flag == DIST_STUDENTST:
+            total += float(-half * math.log(h32) - half_nu1 * math.log(one + e * e * inv_nu2 / h32))
+        else:
+            total += float(-half * (math.log(h32) + e * e / h32))
+        e_prev = e
+
+    return -(total + const * returns.shape[0])
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def batch_neg_loglik(params_mat, returns, flag, backcast_value):
+    """
+    neg_loglik_f32 for every row of params_mat, evaluated in parallel.
+
+    Used to rank many candidate starting points in one call so only the most
+    promising ones are handed to the optimizer. returns must be float32; the
+    optimizer refines the winners in float64 with neg_loglik.
+    """
+    out = np.empty(params_mat.shape[0])
+    for i in prange(params_mat.shape[0]):
+        out[i] = neg_loglik_f32(params_mat[i], returns, flag, backcast_value)
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def last_variance(params, returns, backcast_value):
+    """Conditional variance h_T of the final observation."""
+    mu = params[0]
+    omega = params[1]
+    alpha = params[2]
+    beta = params[3]
+
+    h = omega + (alpha + beta) * backcast_value
+    for t in range(1, returns.shape[0]):
+        e_prev = returns[t - 1] - mu
+        h = omega + alpha * e_prev * e_prev + beta * h
+    return h
+
+
+# Prefer the prebuilt Cython kernels: same results, no first-call compile
+try:
+    from _garch import batch_neg_loglik, last_variance, neg_loglik, neg_loglik_f32  # noqa: F811
+    HAVE_CYTHON = True
+except ImportError:
+    HAVE_CYTHON = False
+
+HAVE_KERNEL = HAVE_CYTHON or HAVE_NUMBA
+
+
+def fit(returns, starting_values, distribution='studentst'):
+    """
+    Maximum-likelihood fit from one set of starting values.
+
+    Returns a dict with the same keys as garch_forecast.summarize_fit(), or
+    None if the optimizer did not reach a finite likelihood.
+    """
+    from scipy.optimize import minimize
+
+    flag = dist_flag(distribution)
+    returns = np.ascontiguousarray(returns, dtype=np.float64)
+    x0 = np.asarray(starting_values, dtype=np.float64)
+    bc = backcast(returns)
+
+    # Same parameter bounds as arch; the omega bounds are in units of v
+    v = float(np.mean(returns ** 2))
+    bounds = [(None, None), (1e-8, 10.0), (0.0, 1.0), (0.0, 1.0)]
+    if flag == DIST_STUDENTST:
+        bounds.append((2.05, 500.0))
+
+    # mu and omega live on the scale of the returns; optimize them in units of
+    # sqrt(v) and v so finite-difference steps and tolerances are comparable
+    # across parameters
+    scale = np.ones_like(x0)
+    scale[0] = np.sqrt(v)
+    scale[1] = v
+
+    res = minimize(
+        lambda z: neg_loglik(z * scale, returns, flag, bc),
+        x0=x0 / scale,
+        method='L-BFGS-B',
+        bounds=bounds,
+        jac='3-point',
+        options={'ftol': 1e-12, 'maxiter': 20000}
+    )
+
+    if not np.isfinite(res.fun) or res.fun >= INFEASIBLE:
+        return None
+
+    params = res.x * scale
+    mu, omega, alpha, beta = (float(p) for p in params[:4])
+    loglik = -float(res.fun)
+    n = returns.shape[0]
+    k = params.shape[0]
+
+    # One-step-ahead variance: sigma^2_{T+1|T} = omega + alpha * e_T^2 + beta * h_T
+    e_last = returns[-1] - mu
+    var_next = omega + alpha * e_last * e_last + beta * last_variance(params, returns, bc)
+
+    summary = {
+        'mu': mu,
+        'omega': omega,
+        'alpha': alpha,
+        'beta': beta,
+        'sigma_next': float(np.sqrt(var_next)),
+        'var_next': float(var_next),
+        'log_likelihood': loglik,
+        'aic': float(2 * k - 2 * loglik),
+        'bic': float(k * np.log(n) - 2 * loglik),
+        'convergence_flag': int(res.status),
+        'num_iterations': int(res.nit),
+    }
+
+    if flag == DIST_STUDENTST:
+        summary['nu'] = float(params[4])
+
+    return summary
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Build the optional Cython GARCH likelihood (_garch.pyx) used by garch_kernel.py.
+
+Usage:
+    python scripts/setup.py build_ext --inplace
+
+The extension is placed next to garch_kernel.py. If it is not built,
+garch_kernel falls back to numba, and garch_forecast to the arch library.
+
+Flags are chosen for the compiler in use (MSVC or GCC/Clang). OpenMP, which
+batch_neg_loglik uses to rank candidates in parallel, is probed first; if the
+compiler or its runtime lacks it (e.g. Apple Clang without libomp) the
+extension is built without it and the ranking loop runs serially.
+
+GCC/Clang builds use -march=native, so the extension only runs on CPUs with
+the build machine's instruction set. Set GARCH_NATIVE=0 for a portable build
+(e.g. a Docker image built on one host and run on another).
+
+Profile-guided builds (driven by build_pgo.sh) set GARCH_PGO=generate for an
+instrumented build, run a representative workload, then rebuild with
+GARCH_PGO=use. Profiles are written to GARCH_PGO_DIR (default: build/pgo).
+PGO needs GCC.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CompileError, LinkError
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+native = os.environ.get('GARCH_NATIVE', '1') != '0'
+
+pgo = os.environ.get('GARCH_PGO', '')
+pgo_dir = os.path.abspath(os.environ.get('GARCH_PGO_DIR', os.path.join(HERE, 'build', 'pgo')))
+if pgo == 'generate':
+    pgo_args = [f'-fprofile-generate={pgo_dir}']
+elif pgo == 'use':
+    # -fprofile-correction: OpenMP threads update the counters without locks
+    pgo_args = [f'-fprofile-use={pgo_dir}', '-fprofile-correction']
+elif pgo:
+    raise SystemExit(f"GARCH_PGO must be 'generate' or 'use', got '{pgo}'")
+else:
+    pgo_args = []
+
+
+def compiler_flags(compiler_type):
+    """(compile_args, link_args, openmp_compile_args, openmp_link_args) for a compiler."""
+    if compiler_type == 'msvc':
+        if pgo_args:
+            raise SystemExit("GARCH_PGO is only supported with GCC")
+        return ['/O2', '/fp:fast'], [], ['/openmp'], []
+
+    compile_args = ['-O3', '-ffast-math', '-flto']
+    if native:
+        compile_args.append('-march=native')
+    if sys.platform == 'darwin':
+        # Apple Clang only accepts OpenMP through the preprocessor, with libomp
+        return compile_args, ['-flto'], ['-Xpreprocessor', '-fopenmp'], ['-lomp']
+    return compile_args, ['-flto'], ['-fopenmp'], ['-fopenmp']
+
+
+def openmp_available(compiler, compile_args, link_args):
+    """Whether a small OpenMP program compiles and links with these flags."""
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'openmp_check.c')
+        with open(source, 'w') as f:
+            f.write('#include <omp.h>\nint main(void) { return omp_get_max_threads() > 0 ? 0 : 1; }\n')
+        try:
+            objects = compiler.compile([source], output_dir=tmp, extra_postargs=compile_args)
+            compiler.link_executable(objects, 'openmp_check', output_dir=tmp, extra_postargs=link_args)
+        except (CompileError, LinkError):
+            return False
+    return True
+
+
+class BuildExt(build_ext):
+    """build_ext that picks flags for the active compiler and probes OpenMP."""
+
+    def build_extensions(self):
+        compile_args, link_args, omp_compile, omp_link = compiler_flags(self.compiler.compiler_type)
+        if openmp_available(self.compiler, omp_compile, omp_link):
+            compile_args, link_args = compile_args + omp_compile, link_args + omp_link
+        else:
+            print("OpenMP not available: building _garch without it (batch ranking runs serially)")
+
+        for ext in self.extensions:
+            ext.extra_compile_args = compile_args + pgo_args
+            ext.extra_link_args = link_args + pgo_args
+        super().build_extensions()
+
+
+extension = Extension(
+    '_garch',
+    sources=[os.path.join(HERE, '_garch.pyx')],
+    include_dirs=[np.get_include()],
+)
+
+if __name__ == '__main__':
+    # --inplace puts the module in the current directory; build next to the scripts
+    os.chdir(HERE)
+    setup(
+        name='garch-kernel',
+        ext_modules=cythonize([extension], language_level=3),
+        cmdclass={'build_ext': BuildExt},
+        zip_safe=False,
+    )
@@ -2,13 +2,17 @@
 """
 Standalone script to generate Extended DEX order signatures using the Python SDK.
 Called from Rust to ensure 100% compatibility with Extended's signature format.
+
+With --server the script stays alive and signs one JSON request per stdin
+line, writing one JSON result per line, so the SDK is imported only once.
+A line of the form {"batch": [request, ...]} is answered with
+{"batch": [result, ...]} in the same order.
 """
 
 import sys
 import json
-import math
 from decimal import Decimal
-from datetime import datetime, timedelta
+from functools import lru_cache
 
 # Add Python SDK to path
 sys.path.insert(0, "../python_sdk-starknet")
@@ -17,12 +21,31 @@ from fast_stark_crypto import get_order_msg_hash, sign
 from x10.perpetual.configuration import StarknetDomain
 
 
+SETTLEMENT_BUFFER_SECONDS = 14 * 24 * 60 * 60
+
+
 def calculate_settlement_expiration(expiry_epoch_millis: int) -> int:
-    """Calculate settlement expiration with 14-day buffer"""
-    expiry_datetime = datetime.fromtimestamp(expiry_epoch_millis / 1000.0)
-    expire_time_with_buffer = expiry_datetime + timedelta(days=14)
-    expire_time_as_seconds = math.ceil(expire_time_with_buffer.timestamp())
-    return expire_time_as_seconds
+    """Calculate settlement expiration with 14-day buffer (seconds, rounded up)"""
+    # Integer ceil-div: same as the SDK's math.ceil((expiry + 14 days).timestamp())
+    # on UTC datetimes, without float or local-timezone/DST effects
+    return -(-expiry_epoch_millis // 1000) + SETTLEMENT_BUFFER_SECONDS
+
+
+@lru_cache(maxsize=64)
+def hex_to_int(value: str) -> int:
+    """Parse a hex string; asset ids and keys repeat across orders, so cache them"""
+    return int(value, 16)
+
+
+@lru_cache(maxsize=8)
+def get_domain(name: str, version: str, chain_id: str, revision: str) -> StarknetDomain:
+    """Build the SNIP12 domain once per distinct set of fields"""
+    return StarknetDomain(
+        name=name,
+        version=version,
+        chain_id=chain_id,
+        revision=revision,
+    )
 
 
 def sign_order(
@@ -57,19 +80,14 @@ def sign_order(
     expiration_seconds = calculate_settlement_expiration(expiration_epoch_millis)
 
     # Convert hex strings to integers
-    base_asset_id_int = int(base_asset_id, 16)
-    quote_asset_id_int = int(quote_asset_id, 16)
-    fee_asset_id_int = int(fee_asset_id, 16)
-    public_key_int = int(public_key, 16)
-    private_key_int = int(private_key, 16)
+    base_asset_id_int = hex_to_int(base_asset_id)
+    quote_asset_id_int = hex_to_int(quote_asset_id)
+    fee_asset_id_int = hex_to_int(fee_asset_id)
+    public_key_int = hex_to_int(public_key)
+    private_key_int = hex_to_int(private_key)
 
     # Create domain
-    domain = StarknetDomain(
-        name=domain_name,
-        version=domain_version,
-        chain_id=domain_chain_id,
-        revision=domain_revision,
-    )
+    domain = get_domain(domain_name, domain_version, domain_chain_id, domain_revision)
 
     # Compute message hash using SDK
     message_hash = get_order_msg_hash(
@@ -100,8 +118,67 @@ def sign_order(
     }
 
 
+def sign_request(input_data: dict) -> dict:
+    """Sign one decoded JSON request (amounts and ids as decimal strings)"""
+    return sign_order(
+        base_asset_id=input_data["base_asset_id"],
+        quote_asset_id=input_data["quote_asset_id"],
+        fee_asset_id=input_data["fee_asset_id"],
+        base_amount=int(input_data["base_amount"]),
+        quote_amount=int(input_data["quote_amount"]),
+        fee_amount=int(input_data["fee_amount"]),
+        position_id=int(input_data["position_id"]),
+        nonce=int(input_data["nonce"]),
+        expiration_epoch_millis=int(input_data["expiration_epoch_millis"]),
+        public_key=input_data["public_key"],
+        private_key=input_data["private_key"],
+        domain_name=input_data.get("domain_name", "Perpetuals"),
+        domain_version=input_data.get("domain_version", "v0"),
+        domain_chain_id=input_data.get("domain_chain_id", "SN_MAIN"),
+        domain_revision=input_data.get("domain_revision", "1"),
+    )
+
+
+def sign_orders_batch(orders: list) -> list:
+    """Sign several decoded requests; failures are reported per order"""
+    results = []
+    for order in orders:
+        try:
+            results.append(sign_request(order))
+        except Exception as e:
+            results.append({"error": str(e)})
+    return results
+
+
+def serve():
+    """Sign line-delimited JSON requests from stdin until EOF"""
+    # Prebuild the default domains outside the loop
+    for chain_id in ("SN_MAIN", "SN_SEPOLIA"):
+        get_domain("Perpetuals", "v0", chain_id, "1")
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+            if "batch" in request:
+                result = {"batch": sign_orders_batch(request["batch"])}
+            else:
+                result = sign_request(request)
+        except Exception as e:
+            # Report per-request errors in-band so the caller's stream stays in sync
+            result = {"error": str(e)}
+        sys.stdout.write(json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+
 def main():
     """Read JSON from stdin, compute signature, write JSON to stdout"""
+    if "--server" in sys.argv:
+        serve()
+        return
+
     try:
         # Read input from stdin
         input_str = sys.stdin.read()
@@ -109,23 +186,7 @@ def main():
         input_data = json.loads(input_str)
 
         # Extract parameters
-        result = sign_order(
-            base_asset_id=input_data["base_asset_id"],
-            quote_asset_id=input_data["quote_asset_id"],
-            fee_asset_id=input_data["fee_asset_id"],
-            base_amount=int(input_data["base_amount"]),
-            quote_amount=int(input_data["quote_amount"]),
-            fee_amount=int(input_data["fee_amount"]),
-            position_id=int(input_data["position_id"]),
-            nonce=int(input_data["nonce"]),
-            expiration_epoch_millis=int(input_data["expiration_epoch_millis"]),
-            public_key=input_data["public_key"],
-            private_key=input_data["private_key"],
-            domain_name=input_data.get("domain_name", "Perpetuals"),
-            domain_version=input_data.get("domain_version", "v0"),
-            domain_chain_id=input_data.get("domain_chain_id", "SN_MAIN"),
-            domain_revision=input_data.get("domain_revision", "1"),
-        )
+        result = sign_request(input_data)
 
         # Write result to stdout
         print(json.dumps(result))
@@ -9,6 +9,7 @@ pub mod k_estimator;
 pub mod market_maker;
 pub mod order_manager_task;
 pub mod pnl_tracker_task;
+pub mod python_worker;
 pub mod rest;
 pub mod rest_backup_task;
 pub mod signature;
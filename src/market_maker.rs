@@ -9,8 +9,10 @@
 use crate::data_loader::{FullDepthSnapshot, RollingWindow, TradeEvent};
 use crate::error::{ConnectorError, Result};
 use crate::k_estimator::{estimate_k_from_depth, generate_delta_grid, KEstimate};
+use crate::python_worker::PythonWorker;
 use crate::types::TradingConfig;
 use std::fmt;
+use std::process::Command;
 
 /// Market parameters calculated from historical data
 #[derive(Debug, Clone)]
@@ -393,6 +395,18 @@ pub fn calculate_volatility_garch_studentt(window: &RollingWindow, sample_interv
     Ok(sigma_daily)
 }
 
+/// Shared `garch_forecast.py --server` process (see `crate::python_worker`)
+///
+/// Spawning Python and importing `arch` costs far more than a fit on a short
+/// window, so one worker is kept alive for every fit.
+static PYTHON_GARCH_WORKER: PythonWorker = PythonWorker::new("Python GARCH worker", garch_worker_command);
+
+fn garch_worker_command() -> Command {
+    let mut command = Command::new("python");
+    command.arg("scripts/garch_forecast.py").arg("--server");
+    command
+}
+
 /// Calculate volatility using Python GARCH with Rust Student's t starting values
 ///
 /// # Arguments
@@ -403,9 +417,6 @@ pub fn calculate_volatility_garch_studentt(window: &RollingWindow, sample_interv
 pub fn calculate_volatility_python_garch(window: &RollingWindow, sample_interval_sec: f64) -> Result<f64> {
     use crate::garch::fit_garch_11_studentt;
     use serde::Deserialize;
-    use std::fs;
-    use std::io::Write;
-    use std::process::Command;
     use tracing::{info, warn};
 
     #[derive(Debug, Deserialize)]
@@ -480,64 +491,43 @@ pub fn calculate_volatility_python_garch(window: &RollingWindow, sample_interval
         }
     };
 
-    // Write returns to temporary file
-    let temp_file = "temp_returns_bot.txt";
-    let mut file = fs::File::create(temp_file)
-        .map_err(|e| ConnectorError::Other(format!("Failed to create temp file: {}", e)))?;
-
-    for r in &log_returns {
-        writeln!(file, "{}", r)
-            .map_err(|e| ConnectorError::Other(format!("Failed to write returns: {}", e)))?;
-    }
-    drop(file);  // Close file
-
-    // STEP 2: Call Python script with Student's t distribution
-    // If we have Rust parameters, pass them as starting values for Python's 100-trial shuffling
-    let mut cmd = Command::new("python");
-    cmd.arg("scripts/garch_forecast.py")
-        .arg(temp_file)
-        .arg("studentst");  // Use Student's t distribution
-
-    if let Some(params) = rust_params {
-        // Pass Rust parameters as starting values for Python's random shuffling
-        cmd.arg(format!("{:.12e}", params.mu));
-        cmd.arg(format!("{:.12e}", params.omega));
-        cmd.arg(format!("{:.6}", params.alpha));
-        cmd.arg(format!("{:.6}", params.beta));
-        info!("Python GARCH: Using Rust parameters as starting values (with 100-trial random shuffling)");
-    } else {
-        info!("Python GARCH: Using default starting values");
-    }
+    // STEP 2: Ask the persistent Python worker for a Student's t fit
+    // If we have Rust parameters, pass them as starting values for Python's random search
+    let starting_values = match rust_params {
+        Some(params) => {
+            info!("Python GARCH: Using Rust parameters as starting values (with random search)");
+            Some([params.mu, params.omega, params.alpha, params.beta])
+        }
+        None => {
+            info!("Python GARCH: Using default starting values");
+            None
+        }
+    };
 
-    let output = cmd
-        .output()
-        .map_err(|e| ConnectorError::Other(format!("Failed to execute Python script: {}", e)))?;
+    let request = serde_json::json!({
+        "returns": log_returns,
+        "distribution": "studentst",
+        "starting_values": starting_values,
+    });
 
-    // Clean up temp file
-    let _ = fs::remove_file(temp_file);
+    let request = serde_json::to_string(&request)
+        .map_err(|e| ConnectorError::Other(format!("Failed to serialize GARCH request: {}", e)))?;
+    let json_str = PYTHON_GARCH_WORKER.request(&request)?;
 
     // Parse JSON output
-    if output.status.success() {
-        let json_str = String::from_utf8(output.stdout)
-            .map_err(|e| ConnectorError::Other(format!("Failed to parse Python output: {}", e)))?;
+    let result: PythonGarchResult = serde_json::from_str(&json_str)
+        .map_err(|e| ConnectorError::Other(format!("Failed to deserialize Python result: {}", e)))?;
 
-        let result: PythonGarchResult = serde_json::from_str(&json_str)
-            .map_err(|e| ConnectorError::Other(format!("Failed to deserialize Python result: {}", e)))?;
+    if result.success {
+        // Scale to daily volatility
+        let sec_per_day = 86400.0;
+        let steps_per_day = sec_per_day / sample_interval_sec;
+        let sigma_daily = result.sigma_next * steps_per_day.sqrt();
 
-        if result.success {
-            // Scale to daily volatility
-            let sec_per_day = 86400.0;
-            let steps_per_day = sec_per_day / sample_interval_sec;
-            let sigma_daily = result.sigma_next * steps_per_day.sqrt();
-
-            info!("Python GARCH Student's t: σ_daily={:.6}", sigma_daily);
-            Ok(sigma_daily)
-        } else {
-            Err(ConnectorError::Other(format!("Python GARCH failed: {}", result.message)))
-        }
+        info!("Python GARCH Student's t: σ_daily={:.6}", sigma_daily);
+        Ok(sigma_daily)
     } else {
-        let error_msg = String::from_utf8_lossy(&output.stderr);
-        Err(ConnectorError::Other(format!("Python script failed: {}", error_msg)))
+        Err(ConnectorError::Other(format!("Python GARCH failed: {}", result.message)))
     }
 }
 
@@ -0,0 +1,102 @@
+//! Long-lived Python helper processes spoken to in line-delimited JSON
+//!
+//! Starting Python and importing its libraries costs far more than a single
+//! request, so the order signer (`scripts/sign_order.py --server`) and the
+//! GARCH fitter (`scripts/garch_forecast.py --server`) are each kept alive and
+//! fed one JSON request per line, answering with one JSON line.
+
+use crate::error::{ConnectorError, Result};
+use std::io::{BufRead, BufReader, Write};
+use std::process::{Child, ChildStdin, ChildStdout, Command, Stdio};
+use std::sync::Mutex;
+
+/// One running child process with piped stdin/stdout
+struct LineJsonChild {
+    child: Child,
+    stdin: ChildStdin,
+    stdout: BufReader<ChildStdout>,
+}
+
+impl LineJsonChild {
+    fn spawn(mut command: Command, name: &str) -> Result<Self> {
+        let mut child = command
+            .stdin(Stdio::piped())
+            .stdout(Stdio::piped())
+            .stderr(Stdio::inherit())
+            .spawn()
+            .map_err(|e| ConnectorError::Other(format!("Failed to start {}: {}", name, e)))?;
+
+        let stdin = child.stdin.take()
+            .ok_or_else(|| ConnectorError::Other(format!("{} has no stdin", name)))?;
+        let stdout = child.stdout.take()
+            .ok_or_else(|| ConnectorError::Other(format!("{} has no stdout", name)))?;
+
+        Ok(Self { child, stdin, stdout: BufReader::new(stdout) })
+    }
+
+    /// Send one request line and return the child's one-line reply
+    fn request(&mut self, line: &str, name: &str) -> Result<String> {
+        self.stdin
+            .write_all(line.as_bytes())
+            .and_then(|_| self.stdin.write_all(b"\n"))
+            .and_then(|_| self.stdin.flush())
+            .map_err(|e| ConnectorError::Other(format!("Failed to write to {}: {}", name, e)))?;
+
+        let mut reply = String::new();
+        let n = self.stdout
+            .read_line(&mut reply)
+            .map_err(|e| ConnectorError::Other(format!("Failed to read from {}: {}", name, e)))?;
+        if n == 0 {
+            return Err(ConnectorError::Other(format!("{} exited", name)));
+        }
+
+        Ok(reply)
+    }
+}
+
+impl Drop for LineJsonChild {
+    fn drop(&mut self) {
+        let _ = self.child.kill();
+        let _ = self.child.wait();
+    }
+}
+
+/// A helper process shared by every caller, spawned on first use
+///
+/// A request that fails on I/O (the child died or closed its pipes) drops the
+/// child, spawns a fresh one and is retried once. Errors the child reports
+/// inside its JSON reply are the caller's to handle.
+pub(crate) struct PythonWorker {
+    name: &'static str,
+    command: fn() -> Command,
+    child: Mutex<Option<LineJsonChild>>,
+}
+
+impl PythonWorker {
+    /// `command` builds the child's command line; stdio is piped by the worker
+    pub(crate) const fn new(name: &'static str, command: fn() -> Command) -> Self {
+        Self { name, command, child: Mutex::new(None) }
+    }
+
+    /// Send one JSON request (a single line) and return the one-line reply
+    pub(crate) fn request(&self, line: &str) -> Result<String> {
+        let mut child = self.child.lock().unwrap_or_else(|e| e.into_inner());
+
+        let mut last_err = None;
+        for _ in 0..2 {
+            if child.is_none() {
+                *child = Some(LineJsonChild::spawn((self.command)(), self.name)?);
+            }
+            match child.as_mut().unwrap().request(line, self.name) {
+                Ok(reply) => return Ok(reply),
+                Err(e) => {
+                    tracing::warn!("{} failed ({}), restarting it", self.name, e);
+                    *child = None;
+                    last_err = Some(e);
+                }
+            }
+        }
+
+        Err(last_err.unwrap())
+    }
+}
@@ -1,13 +1,32 @@
 use crate::error::ConnectorError;
+use crate::python_worker::PythonWorker;
 use crate::types::{OrderSide, Signature};
-use std::io::Write;
-use std::process::{Command, Stdio};
+use std::process::Command;
 
-/// Sign an order using the Python SDK via subprocess
+/// Shared `sign_order.py --server` process (see `crate::python_worker`)
+static PYTHON_SIGNER: PythonWorker = PythonWorker::new("Python signer", signer_command);
+
+fn signer_command() -> Command {
+    // Use path relative to CARGO_MANIFEST_DIR
+    let script_path = std::path::Path::new(env!("CARGO_MANIFEST_DIR"))
+        .join("scripts")
+        .join("sign_order.py");
+
+    let mut command = Command::new("python3");
+    command.arg(script_path).arg("--server");
+    command
+}
+
+/// Sign an order using the Python SDK via a persistent subprocess
 ///
 /// This calls the Python script which uses the exact `fast_stark_crypto` library
 /// to ensure 100% compatibility with Extended DEX's signature format.
 ///
+/// `crate::snip12` is an in-process Rust implementation of the same hash and
+/// signature, checked against golden vectors from this signer in
+/// `src/snip12/tests.rs`. It is not wired in: it replaces this function only
+/// once `cargo test --lib snip12` has been run and passes.
+///
 /// Parameters:
 /// - base_asset_id: Synthetic asset ID (hex string from market config)
 /// - quote_asset_id: Collateral asset ID (hex string from market config)
@@ -55,41 +74,9 @@ pub fn sign_order(
     let input_str = serde_json::to_string(&input_json)
         .map_err(|e| ConnectorError::Other(format!("Failed to serialize input: {}", e)))?;
 
-    // Call Python script (use path relative to CARGO_MANIFEST_DIR)
-    let script_path = std::path::Path::new(env!("CARGO_MANIFEST_DIR"))
-        .join("scripts")
-        .join("sign_order.py");
-
-    let mut child = Command::new("python3")
-        .arg(&script_path)
-        .stdin(Stdio::piped())
-        .stdout(Stdio::piped())
-        .stderr(Stdio::piped())
-        .spawn()
-        .map_err(|e| ConnectorError::Other(format!("Failed to spawn Python process: {}", e)))?;
-
-    // Write input to stdin
-    if let Some(mut stdin) = child.stdin.take() {
-        stdin
-            .write_all(input_str.as_bytes())
-            .map_err(|e| ConnectorError::Other(format!("Failed to write to stdin: {}", e)))?;
-    }
-
-    // Wait for process to complete
-    let output = child
-        .wait_with_output()
-        .map_err(|e| ConnectorError::Other(format!("Failed to wait for Python process: {}", e)))?;
-
-    if !output.status.success() {
-        let stderr = String::from_utf8_lossy(&output.stderr);
-        return Err(ConnectorError::Other(format!(
-            "Python signing failed: {}",
-            stderr
-        )));
-    }
+    let stdout = PYTHON_SIGNER.request(&input_str)?;
 
     // Parse output
-    let stdout = String::from_utf8_lossy(&output.stdout);
     let result: serde_json::Value = serde_json::from_str(&stdout).map_err(|e| {
         ConnectorError::Other(format!(
             "Failed to parse Python output: {}. Output: {}",
@@ -97,6 +84,13 @@ pub fn sign_order(
         ))
     })?;
 
+    if let Some(error) = result["error"].as_str() {
+        return Err(ConnectorError::Other(format!(
+            "Python signing failed: {}",
+            error
+        )));
+    }
+
     let r = result["r"]
         .as_str()
         .ok_or_else(|| ConnectorError::Other("Missing r in signature".to_string()))?
@@ -10,9 +10,10 @@ use super::hex_to_felt;
 ///
 /// Extended requires orders to have an expiration time for settlement.
 /// The settlement expiration is calculated as:
-/// 1. Convert milliseconds to seconds
+/// 1. Convert milliseconds to seconds, rounding up (ceiling)
 /// 2. Add 14 days (1,209,600 seconds)
-/// 3. Round up to nearest second (ceiling)
+///
+/// Matches the SDK's `math.ceil((expiry + 14 days).timestamp())`.
 ///
 /// # Arguments
 /// * `expiry_epoch_millis` - Expiration time in milliseconds since epoch
@@ -20,15 +21,15 @@ use super::hex_to_felt;
 /// # Returns
 /// Settlement expiration time in seconds since epoch
 pub fn calculate_settlement_expiration(expiry_epoch_millis: u64) -> i64 {
-    let expiry_seconds = (expiry_epoch_millis / 1000) as i64;
+    let expiry_seconds = expiry_epoch_millis.div_ceil(1000) as i64;
     let buffer_seconds: i64 = 14 * 24 * 60 * 60; // 14 days
     expiry_seconds + buffer_seconds
 }
 
 /// Compute starknet_keccak hash
 ///
-/// This is standard Keccak-256 truncated to fit Starknet's field element size (251 bits).
-/// Used for computing type hashes in SNIP-12.
+/// This is standard Keccak-256 masked to its low 250 bits (not reduced modulo the
+/// field prime). Used for computing type hashes in SNIP-12.
 ///
 /// # Arguments
 /// * `input` - Input bytes to hash
@@ -40,45 +41,33 @@ pub fn starknet_keccak(input: &[u8]) -> Felt {
     hasher.update(input);
     let result = hasher.finalize();
 
-    // Convert to Felt (automatically truncates to 251 bits)
-    // from_bytes_be expects a 32-byte array
+    // Keep the low 250 bits: clear the top 6 bits of the big-endian digest
     let mut bytes = [0u8; 32];
     bytes.copy_from_slice(&result);
+    bytes[0] &= 0x03;
     Felt::from_bytes_be(&bytes)
 }
 
 /// Compute the type hash for an Order struct
 ///
-/// The order type definition for Extended DEX perpetual orders.
-/// Format: "Order(position_id:felt,base_asset_id:felt,base_amount:felt,
-///          quote_asset_id:felt,quote_amount:felt,fee_amount:felt,
-///          fee_asset_id:felt,expiration:felt,salt:felt)"
+/// Extended's Order struct uses nested types (PositionId, AssetId, Timestamp);
+/// its type hash is the constant hard-coded in the SDK's `fast_stark_crypto`.
+/// Fields are hashed in the order: position_id, base_asset_id, base_amount,
+/// quote_asset_id, quote_amount, fee_asset_id, fee_amount, expiration, salt.
 pub fn get_order_type_hash() -> Felt {
-    let order_type_string = concat!(
-        "Order(",
-        "position_id:felt,",
-        "base_asset_id:felt,",
-        "base_amount:felt,",
-        "quote_asset_id:felt,",
-        "quote_amount:felt,",
-        "fee_amount:felt,",
-        "fee_asset_id:felt,",
-        "expiration:felt,",
-        "salt:felt",
-        ")"
-    );
-
-    starknet_keccak(order_type_string.as_bytes())
+    Felt::from_hex_unchecked("0x36da8d51815527cabfaa9c982f564c80fa7429616739306036f1f9b608dd112")
 }
 
 /// Compute the type hash for StarknetDomain
+///
+/// SNIP-12 revision 1 quotes every name in the encoded type.
 pub fn get_domain_type_hash() -> Felt {
     let domain_type_string = concat!(
-        "StarknetDomain(",
-        "name:shortstring,",
-        "version:shortstring,",
-        "chainId:shortstring,",
-        "revision:shortstring",
+        "\"StarknetDomain\"(",
+        "\"name\":\"shortstring\",",
+        "\"version\":\"shortstring\",",
+        "\"chainId\":\"shortstring\",",
+        "\"revision\":\"shortstring\"",
         ")"
     );
 
@@ -155,8 +144,8 @@ pub fn hash_order_struct(
     let expiration_felt = Felt::from(expiration_seconds as u64);
 
     // Hash all fields together using Poseidon
-    // NOTE: Field ordering must match Extended's smart contract Order struct
-    // Current ordering is based on standard SNIP-12 conventions but may need adjustment
+    // NOTE: Field ordering must match Extended's smart contract Order struct,
+    // where fee_asset_id comes before fee_amount
     let struct_hash = poseidon_hash_many(&[
         type_hash,
         position_id_felt,
@@ -164,8 +153,8 @@ pub fn hash_order_struct(
         base_amount_felt,
         quote_asset_id_felt,
         quote_amount_felt,
-        fee_amount_felt,
         fee_asset_id_felt,
+        fee_amount_felt,
         expiration_felt,
         salt_felt,
     ]);
@@ -176,13 +165,8 @@ pub fn hash_order_struct(
 /// Compute the final SNIP-12 message hash for an order
 ///
 /// This combines the domain separator, account address, and order struct hash
-/// according to the SNIP-12 specification.
-///
-/// # Note
-/// This implementation follows standard SNIP-12 revision 1 conventions.
-/// The actual Order struct field ordering used by Extended DEX may differ
-/// from this implementation. For production use, consider using the Python SDK
-/// until the exact struct definition is confirmed.
+/// according to the SNIP-12 specification. Produces the same hash as the SDK's
+/// `fast_stark_crypto.get_order_msg_hash` (see the golden vectors in `tests.rs`).
 pub fn get_order_message_hash(
     position_id: u64,
     base_asset_id: &str,
@@ -218,8 +202,8 @@ pub fn get_order_message_hash(
     // Convert public key
     let account = hex_to_felt(user_public_key)?;
 
-    // Compute message prefix hash
-    let prefix = starknet_keccak(b"StarkNet Message");
+    // Message prefix is the short string "StarkNet Message" (not a keccak)
+    let prefix = encode_short_string("StarkNet Message");
 
     // Final message hash: poseidon_hash([prefix, domain_hash, account, struct_hash])
     let message_hash = poseidon_hash_many(&[prefix, domain_hash, account, struct_hash]);
@@ -239,6 +223,9 @@ mod tests {
         // Should add 14 days in seconds
         let expected = (now_millis / 1000) as i64 + (14 * 24 * 60 * 60);
         assert_eq!(expiration, expected);
+
+        // Partial seconds round up
+        assert_eq!(calculate_settlement_expiration(now_millis + 1), expected + 1);
     }
 
     #[test]
@@ -283,11 +270,11 @@ mod tests {
         use crate::snip12::felt_to_hex;
 
         let domain_type_string = concat!(
-            "StarknetDomain(",
-            "name:shortstring,",
-            "version:shortstring,",
-            "chainId:shortstring,",
-            "revision:shortstring",
+            "\"StarknetDomain\"(",
+            "\"name\":\"shortstring\",",
+            "\"version\":\"shortstring\",",
+            "\"chainId\":\"shortstring\",",
+            "\"revision\":\"shortstring\"",
             ")"
         );
 
@@ -3,38 +3,16 @@
 /// This module implements the SNIP-12 revision 1 standard for signing orders
 /// on Extended DEX using pure Rust, without relying on the Python SDK.
 ///
-/// # Current Status
+/// Message hashes and signatures match the SDK's `fast_stark_crypto`
+/// (golden vectors in `tests.rs`):
 ///
-/// **⚠️ Work in Progress**: This implementation correctly handles all SNIP-12 components
-/// (domain encoding, type hashing, Poseidon hashing) but produces different message
-/// hashes than Extended's Python SDK. This is due to an unknown Order struct field
-/// ordering difference in Extended's smart contract.
-///
-/// **Recommendation**: For production use, continue using Python SDK integration
-/// (via subprocess) until the exact Order struct definition is obtained from Extended.
-///
-/// # What's Implemented & Verified
-///
-/// - ✅ Domain separator encoding (Perpetuals, v0, SN_MAIN/SN_SEPOLIA, revision 1)
-/// - ✅ Type hash computation (Keccak-256 with modular reduction)
-/// - ✅ Short string encoding for domain fields
-/// - ✅ Negative number handling for signed amounts
-/// - ✅ Settlement expiration calculation (14-day buffer)
-/// - ✅ Poseidon hashing for struct and message hashes
-/// - ✅ ECDSA signing on STARK curve
-///
-/// # What Needs Confirmation
-///
-/// - ❓ Exact Order struct field ordering (currently uses standard conventions)
-/// - ❓ Whether user_public_key is part of the Order struct or added separately
-///
-/// # Future Work
-///
-/// Once Extended's exact Order struct definition is obtained:
-/// 1. Update `hash::get_order_type_hash()` with correct field order
-/// 2. Update `hash::hash_order_struct()` to match
-/// 3. Test against Python SDK to verify signatures match
-/// 4. Switch production code to use this pure Rust implementation
+/// - Domain: `"StarknetDomain"(...)` type hash (quoted SNIP-12 rev 1 encoding),
+///   short-string name/version/chainId, revision as the integer 1
+/// - Order: Extended's Order type hash, with fee_asset_id before fee_amount
+/// - Type hashes use starknet_keccak (Keccak-256 masked to 250 bits)
+/// - Settlement expiration: ceil(expiry_ms / 1000) + 14 days
+/// - Message: poseidon("StarkNet Message", domain, public key, order)
+/// - ECDSA on the STARK curve with an RFC 6979 deterministic k
 
 use starknet_crypto::Felt;
 
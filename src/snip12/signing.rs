@@ -1,6 +1,6 @@
 /// Order signing using ECDSA on the STARK curve
 
-use starknet_crypto::{sign as stark_sign, Felt};
+use starknet_crypto::{rfc6979_generate_k, sign as stark_sign, Felt};
 
 use super::domain::StarknetDomain;
 use super::hash::get_order_message_hash;
@@ -67,12 +67,14 @@ pub fn sign_order(
 
     // Convert private key from hex
     let private_key_felt = hex_to_felt(private_key)
-        .map_err(|e| format!("Failed to parse private key '{}': {}", private_key, e))?;
+        .map_err(|e| format!("Failed to parse private key: {}", e))?;
 
-    // Sign the message hash using starknet-crypto
-    let signature =
-        stark_sign(&private_key_felt, &message_hash, &Felt::from(nonce))
-            .map_err(|e| format!("Failed to sign: {:?}", e))?;
+    // Sign the message hash using starknet-crypto with an RFC 6979 deterministic k
+    // (as fast_stark_crypto does). k must never be predictable: reusing or
+    // guessing it reveals the private key.
+    let k = rfc6979_generate_k(&message_hash, &private_key_felt, None);
+    let signature = stark_sign(&private_key_felt, &message_hash, &k)
+        .map_err(|e| format!("Failed to sign: {:?}", e))?;
 
     // Convert signature components to hex strings
     let r = felt_to_hex(&signature.r);
@@ -1,7 +1,8 @@
 /// Test vectors and comparison with Python SDK
 ///
 /// This module provides utilities to test the Rust SNIP-12 implementation
-/// against the Python SDK to ensure 100% compatibility.
+/// against the Python SDK to ensure 100% compatibility. The expected values in
+/// the vectors were produced by `scripts/sign_order.py` (`fast_stark_crypto`).
 
 #[cfg(test)]
 use super::*;
@@ -68,9 +69,9 @@ impl OrderTestVector {
             private_key: "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abc"
                 .to_string(),  // Valid 251-bit key
             domain_chain_id: "SN_MAIN".to_string(),
-            expected_r: None,  // Will be generated during test
-            expected_s: None,
-            expected_message_hash: None,
+            expected_r: Some("0x5b44364eacbb456567fa7cb10e571e5563fae9187e07c76fc39e6761ee85746".to_string()),
+            expected_s: Some("0x365743556c9ee01a97b5103d907156aecdcc63fb487acc96b28065678593745".to_string()),
+            expected_message_hash: Some("0x2352246676e3ecb7d5c528d9881da436dc3a784aad7e5dabc309f90ff4aebee".to_string()),
         }
     }
 
@@ -153,15 +154,24 @@ impl OrderTestVector {
         )
     }
 
-    /// Compare Rust and Python implementations
-    ///
-    /// Note: This currently shows differences due to unknown Order struct field ordering.
-    /// This is informational only - the comparison will not match until Extended's
-    /// exact struct definition is obtained.
+    /// Check the Rust implementation against this vector's expected outputs
+    pub fn assert_matches_expected(&self) {
+        let sig = self.sign_with_rust().expect("Rust signing failed");
+
+        if let Some(expected) = &self.expected_message_hash {
+            assert_eq!(sig.message_hash.as_ref(), Some(expected), "message hash differs from Python SDK");
+        }
+        if let Some(expected) = &self.expected_r {
+            assert_eq!(&sig.r, expected, "signature r differs from Python SDK");
+        }
+        if let Some(expected) = &self.expected_s {
+            assert_eq!(&sig.s, expected, "signature s differs from Python SDK");
+        }
+    }
+
+    /// Compare Rust and Python implementations live (needs the Python SDK installed)
     pub fn compare_implementations(&self) {
         println!("\n=== COMPARING RUST VS PYTHON ===\n");
-        println!("NOTE: Signatures currently differ due to unknown Order struct field ordering");
-        println!("See DOC/SNIP12_STATUS.md for details\n");
 
         let python_result = match self.sign_with_python() {
             Ok(r) => r,
@@ -191,7 +201,7 @@ impl OrderTestVector {
         if hashes_match {
             println!("✓ Message hashes MATCH");
         } else {
-            println!("✗ Message hashes DIFFER (expected - struct ordering issue)");
+            println!("✗ Message hashes DIFFER");
         }
 
         println!("\n--- Signatures ---");
@@ -203,11 +213,9 @@ impl OrderTestVector {
         println!("  s: {}", rust_sig.s);
 
         if rust_sig.r == python_r && rust_sig.s == python_s {
-            println!("\n✓ SIGNATURES MATCH! 🎉");
-            println!("The Rust implementation is now ready for production use!");
+            println!("\n✓ SIGNATURES MATCH");
         } else {
-            println!("\n✗ Signatures differ (expected until struct definition is fixed)");
-            println!("For production, use Python subprocess integration");
+            println!("\n✗ Signatures differ");
         }
     }
 }
@@ -215,6 +223,30 @@ impl OrderTestVector {
 #[cfg(test)]
 mod comparison_tests {
     use super::*;
+    use starknet_crypto::{get_public_key, verify};
+
+    #[test]
+    fn test_buy_order_matches_python_vector() {
+        OrderTestVector::buy_order().assert_matches_expected();
+    }
+
+    #[test]
+    fn test_sell_order_matches_python_vector() {
+        OrderTestVector::sell_order().assert_matches_expected();
+    }
+
+    #[test]
+    fn test_signature_verifies() {
+        let vector = OrderTestVector::buy_order();
+        let sig = vector.sign_with_rust().unwrap();
+
+        let private_key = hex_to_felt(&vector.private_key).unwrap();
+        let message_hash = hex_to_felt(sig.message_hash.as_ref().unwrap()).unwrap();
+        let r = hex_to_felt(&sig.r).unwrap();
+        let s = hex_to_felt(&sig.s).unwrap();
+
+        assert!(verify(&get_public_key(&private_key), &message_hash, &r, &s).unwrap());
+    }
 
     #[test]
     #[ignore] // Run with: cargo test -- --ignored --nocapture
@@ -0,0 +1,25 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The tools are standalone scripts, not packages: import them from their folders
+for path in (ROOT, os.path.join(ROOT, "scripts"), os.path.join(ROOT, "python_sdk-starknet")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+@pytest.fixture(scope="session")
+def garch_returns():
+    """2000 returns simulated from a GARCH(1,1) with Student's t(6) shocks."""
+    rng = np.random.default_rng(12345)
+    omega, alpha, beta, nu = 2e-7, 0.08, 0.9, 6.0
+    h = omega / (1.0 - alpha - beta)
+    returns = np.empty(2000)
+    for t in range(returns.shape[0]):
+        returns[t] = 1e-4 + np.sqrt(h) * rng.standard_t(nu) * np.sqrt((nu - 2.0) / nu)
+        h = omega + alpha * (returns[t] - 1e-4) ** 2 + beta * h
+    return returns
@@ -0,0 +1,139 @@
+import fnmatch
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+import backup_project
+
+
+def naive_should_exclude(rel_path):
+    """Reference: every pattern checked against every path component."""
+    parts = rel_path.split(os.sep)
+    for pattern in backup_project.EXCLUDE_PATTERNS:
+        if pattern.endswith(("/", "\\")):
+            if any(fnmatch.fnmatch(part, pattern.rstrip("/\\")) for part in parts):
+                return True
+        elif fnmatch.fnmatch(rel_path, pattern) or fnmatch.fnmatch(parts[-1], pattern):
+            return True
+    return False
+
+
+SAMPLE_PATHS = [
+    "src/main.rs",
+    "src/data_loader.rs",
+    "src/bin/market_maker_bot.rs",
+    "target/release/market_maker_bot",
+    "data/eth_usd/trades.csv",
+    "data/readme.txt",
+    "my_data/notes.txt",
+    "scripts/__pycache__/garch_forecast.cpython-311.pyc",
+    "scripts/garch_forecast.py",
+    "output.log",
+    "deep/nested/.git/config",
+    "Cargo.lock",
+    "Cargo.toml",
+    "extended_MM.zip",
+    "backup_2024.zip",
+    "notes.txt~",
+    ".DS_Store",
+    "python/venv/lib/site.py",
+]
+
+
+@pytest.mark.parametrize("rel_path", SAMPLE_PATHS)
+def test_should_exclude_matches_naive_patterns(rel_path):
+    rel_path = rel_path.replace("/", os.sep)
+    assert backup_project.should_exclude(rel_path) == naive_should_exclude(rel_path)
+
+
+def test_dir_exclusion_is_memoized_per_directory():
+    backup_project._dir_excluded.cache_clear()
+
+    for name in ("a.rs", "b.rs", "c.rs"):
+        assert not backup_project.should_exclude(os.path.join("src", "bin", name))
+    for name in ("a.o", "b.o"):
+        assert backup_project.should_exclude(os.path.join("target", "debug", name))
+
+    info = backup_project._dir_excluded.cache_info()
+    # One entry per distinct directory prefix, reused by every later file
+    assert info.currsize == 5  # '', src, src/bin, target, target/debug
+    assert info.hits >= 3
+
+
+def make_tree(root):
+    files = {
+        "src/main.rs": b"fn main() {}\n" * 100,
+        "scripts/garch_forecast.py": b"print('hi')\n" * 100,
+        "docs/logo.png": os.urandom(2048),
+        "target/release/bot": b"binary",
+        "data/eth_usd/trades.csv": b"1,2,3\n",
+        "run.log": b"log line\n",
+    }
+    for rel, data in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return files
+
+
+def test_zip_backup_contents(tmp_path, monkeypatch):
+    monkeypatch.setattr(backup_project, "zstd", None)
+    project = tmp_path / "project"
+    files = make_tree(project)
+
+    backup_project.create_backup(project, tmp_path)
+
+    with zipfile.ZipFile(tmp_path / "extended_MM.zip") as zf:
+        assert zf.testzip() is None
+        names = set(zf.namelist())
+        assert names == {"src/main.rs", "scripts/garch_forecast.py", "docs/logo.png"}
+        for name in names:
+            assert zf.read(name) == files[name]
+        # Already-compressed formats are stored, everything else deflated
+        assert zf.getinfo("docs/logo.png").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("src/main.rs").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_tar_zst_backup_contents(tmp_path):
+    zstd = pytest.importorskip("zstandard")
+    if backup_project.zstd is None:
+        pytest.skip("backup_project loaded without zstandard")
+    project = tmp_path / "project"
+    files = make_tree(project)
+
+    backup_project.create_backup(project, tmp_path)
+
+    with open(tmp_path / "extended_MM.tar.zst", "rb") as fh, \
+            zstd.ZstdDecompressor().stream_reader(fh) as reader, \
+            tarfile.open(fileobj=reader, mode="r|") as tar:
+        contents = {member.name: tar.extractfile(member).read() for member in tar}
+
+    assert contents == {name: files[name] for name in ("src/main.rs", "scripts/garch_forecast.py", "docs/logo.png")}
+
+
+def test_zip_backup_streams_files_from_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(backup_project, "zstd", None)
+    project = tmp_path / "project"
+    make_tree(project)
+
+    written = []
+    write = zipfile.ZipFile.write
+
+    def spy_write(self, filename, arcname=None, *args, **kwargs):
+        written.append(arcname)
+        return write(self, filename, arcname, *args, **kwargs)
+
+    def no_writestr(self, *args, **kwargs):
+        raise AssertionError("zip backups must not read whole files into memory")
+
+    monkeypatch.setattr(zipfile.ZipFile, "write", spy_write)
+    monkeypatch.setattr(zipfile.ZipFile, "writestr", no_writestr)
+
+    backup_project.create_backup(project, tmp_path, compresslevel=9)
+
+    assert sorted(written) == sorted(os.path.join(*name.split("/")) for name in
+                                     ("src/main.rs", "scripts/garch_forecast.py", "docs/logo.png"))
+    with zipfile.ZipFile(tmp_path / "extended_MM.zip") as zf:
+        assert zf.testzip() is None
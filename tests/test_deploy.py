@@ -0,0 +1,161 @@
+import gzip
+import importlib
+import io
+import platform
+import tarfile
+import time
+
+import pytest
+
+import deploy
+
+
+def check(path):
+    base_name = path.rpartition("/")[2]
+    return deploy.is_excluded(path, base_name, path.split("/"))
+
+
+@pytest.mark.parametrize("path, excluded", [
+    ("extended_mm/src/main.rs", False),
+    ("extended_mm/target/release/bot", True),
+    ("extended_mm/data/eth_usd/trades.csv", True),
+    ("extended_mm/src/data_loader.rs", False),
+    ("extended_mm/prices.csv", True),
+    ("extended_mm/output.log", True),
+    ("extended_mm/lighter.pem", True),
+    ("extended_mm/deploy.py", True),
+    # Exact names only match the whole basename
+    ("extended_mm/scripts/redeploy.py", False),
+    ("extended_mm/src/null_check.rs", False),
+    ("extended_mm/nul", True),
+    ("extended_mm/backup_2024.zip", True),
+    ("extended_mm/.deploy_cache.json", True),
+    ("extended_mm/Cargo.lock", False),
+])
+def test_is_excluded(path, excluded):
+    assert check(path) == excluded
+
+
+def test_deploy_cache_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(deploy, "DEPLOY_CACHE_FILE", str(tmp_path / "cache.json"))
+    assert deploy.load_deploy_cache() == {}
+
+    files = {"extended_mm/src/main.rs": [1700000000, 42]}
+    deploy.save_deploy_cache(files)
+    assert deploy.load_deploy_cache() == files
+
+    # A cache written for another target is ignored
+    monkeypatch.setattr(deploy, "REMOTE_HOST", "10.0.0.1")
+    assert deploy.load_deploy_cache() == {}
+
+
+class FakeSsh:
+    """Stands in for the `ssh ... tar -x` process and keeps what was streamed."""
+
+    def __init__(self, cmd, stdin=None):
+        self.received = io.BytesIO()
+        self.stdin = self
+        self.returncode = 0
+        FakeSsh.last = self
+
+    def write(self, data):
+        return self.received.write(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    def wait(self):
+        return self.returncode
+
+    def kill(self):
+        self.returncode = -9
+
+    def names(self):
+        with tarfile.open(fileobj=io.BytesIO(gzip.decompress(self.received.getvalue()))) as tar:
+            return {m.name for m in tar.getmembers() if m.isfile()}
+
+
+def test_incremental_tar_deploy_ships_only_changed_files(tmp_path, monkeypatch):
+    project = tmp_path / "project"
+    (project / "src").mkdir(parents=True)
+    (project / "target").mkdir()
+    (project / "src" / "main.rs").write_text("fn main() {}\n")
+    (project / "src" / "lib.rs").write_text("pub mod x;\n")
+    (project / "target" / "bot").write_text("binary")
+
+    monkeypatch.setattr(deploy, "LOCAL_PATH", str(project))
+    monkeypatch.setattr(deploy, "DEPLOY_CACHE_FILE", str(tmp_path / "cache.json"))
+    monkeypatch.setattr(deploy, "SSH_KEY", "key.pem")
+    monkeypatch.setattr(deploy.shutil, "which", lambda name: None)  # no pigz
+    monkeypatch.setattr(deploy.subprocess, "Popen", FakeSsh)
+
+    assert deploy.deploy_with_scp()
+    assert FakeSsh.last.names() == {"extended_mm/src/main.rs", "extended_mm/src/lib.rs"}
+
+    # Nothing changed: nothing shipped
+    assert deploy.deploy_with_scp()
+    assert FakeSsh.last.names() == set()
+
+    # One file changed (size differs): only it is shipped
+    (project / "src" / "lib.rs").write_text("pub mod x;\npub mod y;\n")
+    assert deploy.deploy_with_scp()
+    assert FakeSsh.last.names() == {"extended_mm/src/lib.rs"}
+
+    # --full resends everything
+    assert deploy.deploy_with_scp(full=True)
+    assert FakeSsh.last.names() == {"extended_mm/src/main.rs", "extended_mm/src/lib.rs"}
+
+
+def test_rsync_version(monkeypatch):
+    class Result:
+        stdout = "rsync  version 2.6.9  protocol version 29\n"
+
+    monkeypatch.setattr(deploy.subprocess, "run", lambda *args, **kwargs: Result())
+    assert deploy.rsync_version() == (2, 6, 9)
+
+    Result.stdout = "rsync  version v3.2.7  protocol version 31\n"
+    assert deploy.rsync_version() == (3, 2, 7)
+
+
+def test_stall_watchdog_fires_only_on_inactivity():
+    stalled = []
+    watchdog = deploy.StallWatchdog(0.2, lambda: stalled.append(True))
+    writer = deploy.ProgressWriter(io.BytesIO(), watchdog)
+    watchdog.start()
+
+    # Keep writing for well past the timeout: a busy transfer is never killed
+    for _ in range(10):
+        writer.write(b"chunk")
+        time.sleep(0.05)
+    assert not watchdog.fired.is_set()
+
+    # Then go quiet
+    assert watchdog.fired.wait(2.0)
+    assert stalled == [True]
+    watchdog.cancel()
+
+
+def test_stall_watchdog_cancel():
+    watchdog = deploy.StallWatchdog(0.1, lambda: pytest.fail("cancelled watchdog fired"))
+    watchdog.start()
+    watchdog.cancel()
+    watchdog._thread.join(1.0)
+    assert not watchdog._thread.is_alive()
+    assert not watchdog.fired.is_set()
+
+
+@pytest.mark.parametrize("system, multiplexed", [("Linux", True), ("Darwin", True), ("Windows", False)])
+def test_ssh_opts_use_control_master_off_windows(monkeypatch, system, multiplexed):
+    monkeypatch.setattr(platform, "system", lambda: system)
+    try:
+        opts = importlib.reload(deploy).SSH_OPTS
+    finally:
+        monkeypatch.undo()
+        importlib.reload(deploy)
+
+    assert ("ControlMaster=auto" in opts) == multiplexed
+    assert any(opt.startswith("ControlPath=") for opt in opts) == multiplexed
+    assert "StrictHostKeyChecking=no" in opts
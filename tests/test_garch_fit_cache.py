@@ -0,0 +1,129 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import garch_forecast
+
+STARTING_VALUES = [1e-4, 2e-7, 0.08, 0.9]
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(garch_forecast, "CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_cache_key_covers_every_input(garch_returns):
+    key = garch_forecast.fit_cache_key(garch_returns, "studentst", STARTING_VALUES, seed=1)
+    assert key == garch_forecast.fit_cache_key(garch_returns.copy(), "studentst", STARTING_VALUES, seed=1)
+
+    changed = garch_returns.copy()
+    changed[-1] += 1e-9
+    assert key != garch_forecast.fit_cache_key(changed, "studentst", STARTING_VALUES, seed=1)
+    assert key != garch_forecast.fit_cache_key(garch_returns, "normal", STARTING_VALUES, seed=1)
+    assert key != garch_forecast.fit_cache_key(garch_returns, "studentst", STARTING_VALUES[::-1], seed=1)
+    assert key != garch_forecast.fit_cache_key(garch_returns, "studentst", STARTING_VALUES, seed=2)
+    assert key != garch_forecast.fit_cache_key(garch_returns, "studentst", STARTING_VALUES, seed=None)
+
+
+def test_cache_key_covers_backend_and_search(garch_returns, monkeypatch):
+    key = garch_forecast.fit_cache_key(garch_returns, "studentst", STARTING_VALUES, seed=1)
+
+    monkeypatch.setattr(garch_forecast, "fit_backend", lambda: "other")
+    assert key != garch_forecast.fit_cache_key(garch_returns, "studentst", STARTING_VALUES, seed=1)
+    monkeypatch.undo()
+
+    monkeypatch.setattr(garch_forecast, "NUM_TRIALS", garch_forecast.NUM_TRIALS + 1)
+    assert key != garch_forecast.fit_cache_key(garch_returns, "studentst", STARTING_VALUES, seed=1)
+    monkeypatch.undo()
+
+    monkeypatch.setattr(garch_forecast, "CACHE_VERSION", "older")
+    assert key != garch_forecast.fit_cache_key(garch_returns, "studentst", STARTING_VALUES, seed=1)
+
+
+def test_store_and_load_round_trip(cache_dir):
+    assert garch_forecast.load_cached_fit("missing") is None
+
+    result = {"success": True, "sigma_next": 0.01, "log_likelihood": 123.5}
+    garch_forecast.store_cached_fit("abc", result)
+    assert garch_forecast.load_cached_fit("abc") == result
+    # No temp files left behind
+    assert sorted(os.listdir(cache_dir)) == ["abc.json"]
+
+
+def test_eviction_keeps_most_recently_used(cache_dir, monkeypatch):
+    monkeypatch.setattr(garch_forecast, "CACHE_MAX_FILES", 2)
+
+    for i, key in enumerate(("a", "b")):
+        garch_forecast.store_cached_fit(key, {"i": i})
+        os.utime(cache_dir / f"{key}.json", (1000 + i, 1000 + i))
+
+    # Reading "a" makes "b" the least recently used entry
+    assert garch_forecast.load_cached_fit("a") == {"i": 0}
+    garch_forecast.store_cached_fit("c", {"i": 2})
+
+    assert sorted(os.listdir(cache_dir)) == ["a.json", "c.json"]
+
+
+def test_repeated_fit_is_served_from_cache(garch_returns, cache_dir, monkeypatch):
+    first = garch_forecast.fit_garch_and_forecast(garch_returns, "normal", STARTING_VALUES, n_jobs=1, seed=3)
+    assert first["success"]
+
+    def no_search(*args, **kwargs):
+        raise AssertionError("cache hit expected, search ran")
+
+    monkeypatch.setattr(garch_forecast, "_ranked_search", no_search)
+    monkeypatch.setattr(garch_forecast, "_round_search", no_search)
+
+    second = garch_forecast.fit_garch_and_forecast(garch_returns, "normal", STARTING_VALUES, n_jobs=1, seed=3)
+    assert second == first
+
+    # Another seed is a different request
+    other = garch_forecast.fit_garch_and_forecast(garch_returns, "normal", STARTING_VALUES, n_jobs=1, seed=4)
+    assert not other["success"]
+    assert "cache hit expected" in other["message"]
+
+    # use_cache=False neither reads nor writes
+    monkeypatch.undo()
+    monkeypatch.setattr(garch_forecast, "CACHE_DIR", str(cache_dir))
+    files = set(os.listdir(cache_dir))
+    np.testing.assert_allclose(
+        garch_forecast.fit_garch_and_forecast(
+            garch_returns, "normal", STARTING_VALUES, n_jobs=1, seed=3, use_cache=False
+        )["log_likelihood"],
+        first["log_likelihood"],
+    )
+    assert set(os.listdir(cache_dir)) == files
+
+
+CACHE_HIT_SCRIPT = """
+import sys
+import numpy as np
+import garch_forecast
+
+garch_forecast.CACHE_DIR = sys.argv[1]
+returns = np.load(sys.argv[2])
+sv = [1e-4, 2e-7, 0.08, 0.9]
+
+key = garch_forecast.fit_cache_key(returns, "normal", sv, seed=3)
+garch_forecast.store_cached_fit(key, {"success": True, "sigma_next": 0.01})
+assert garch_forecast.fit_garch_and_forecast(returns, "normal", sv, seed=3)["sigma_next"] == 0.01
+assert garch_forecast.fit_garch_and_forecast(returns, "normal", sv, forecast_only=True)["success"]
+print(sorted(name for name in ("numba", "garch_kernel", "arch") if name in sys.modules))
+"""
+
+
+def test_cache_hit_and_forecast_only_skip_kernel_import(garch_returns, tmp_path):
+    returns_path = tmp_path / "returns.npy"
+    np.save(returns_path, garch_returns)
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+    out = subprocess.run(
+        [sys.executable, "-c", CACHE_HIT_SCRIPT, str(tmp_path / "cache"), str(returns_path)],
+        capture_output=True, text=True, env=env, check=True,
+    ).stdout
+
+    assert out.strip() == "[]"
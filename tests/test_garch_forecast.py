@@ -0,0 +1,129 @@
+import io
+import json
+import warnings
+
+import numpy as np
+import pytest
+
+import garch_forecast
+
+arch = pytest.importorskip("arch")
+
+
+@pytest.fixture(scope="module")
+def arch_result(garch_returns):
+    # Percent scale: arch's optimizer does not converge reliably on raw returns
+    model = garch_forecast.build_model(garch_returns * 100.0, "studentst")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return model.fit(disp="off", show_warning=False)
+
+
+def arch_var_next(result):
+    return result.forecast(horizon=1, reindex=False).variance.iloc[-1, 0]
+
+
+def test_summarize_fit_forecast_matches_arch(arch_result):
+    summary = garch_forecast.summarize_fit(arch_result)
+
+    assert summary["var_next"] == pytest.approx(arch_var_next(arch_result), rel=1e-12)
+    assert summary["sigma_next"] == pytest.approx(np.sqrt(summary["var_next"]))
+    assert summary["log_likelihood"] == arch_result.loglikelihood
+
+
+def test_forecast_only_matches_arch(garch_returns, arch_result):
+    params = arch_result.params
+    starting_values = [params["mu"], params["omega"], params["alpha[1]"], params["beta[1]"]]
+
+    result = garch_forecast.fit_garch_and_forecast(garch_returns * 100.0, "studentst", starting_values,
+                                                   forecast_only=True)
+
+    assert result["success"]
+    assert result["alpha"] == params["alpha[1]"]
+    # Starts from the unconditional variance instead of arch's backcast; the
+    # difference has decayed away after 2000 observations
+    assert result["var_next"] == pytest.approx(arch_var_next(arch_result), rel=1e-9)
+
+
+def test_forecast_only_needs_parameters(garch_returns):
+    result = garch_forecast.fit_garch_and_forecast(garch_returns, forecast_only=True)
+    assert not result["success"]
+    assert "forecast_only" in result["message"]
+
+
+def test_forecast_garch_nonstationary_starts_from_sample_variance():
+    returns = np.array([0.01, -0.02, 0.015])
+    h = garch_forecast.forecast_garch(returns, 0.0, 1e-6, 0.5, 0.6)
+
+    expected = float(np.var(returns))
+    for e in returns:
+        expected = 1e-6 + 0.5 * e * e + 0.6 * expected
+    assert h == pytest.approx(expected)
+
+
+def test_load_returns_plain_file(tmp_path, garch_returns):
+    path = tmp_path / "returns.txt"
+    np.savetxt(path, garch_returns, fmt="%.17g")
+    np.testing.assert_array_equal(garch_forecast.load_returns(str(path)), garch_returns)
+
+
+@pytest.mark.parametrize("text", [
+    "# log returns\n0.001\n-0.002\n0.0005\n",
+    "0.001\n-0.002\n0.0005 # last\n",
+    "\n\n0.001\n-0.002\n0.0005\n",
+])
+def test_load_returns_handles_comments_and_blank_lines(tmp_path, text):
+    path = tmp_path / "returns.txt"
+    path.write_text(text)
+    np.testing.assert_array_equal(garch_forecast.load_returns(str(path)), [0.001, -0.002, 0.0005])
+
+
+def test_load_returns_rejects_garbage(tmp_path):
+    path = tmp_path / "returns.txt"
+    path.write_text("0.001\nnot a number\n")
+    with pytest.raises(ValueError):
+        garch_forecast.load_returns(str(path))
+
+
+def test_round_search_runs_every_trial_on_a_plateau(garch_returns, monkeypatch):
+    garch_kernel = pytest.importorskip("garch_kernel")
+    monkeypatch.setattr(garch_kernel, "HAVE_KERNEL", False)
+
+    trials = []
+
+    def constant_trial(sv):
+        trials.append(sv)
+        return {"mu": 1e-4, "omega": 2e-7, "alpha": 0.08, "beta": 0.9, "nu": 6.0, "log_likelihood": 100.0,
+                "sigma_next": 0.01, "var_next": 1e-4}
+
+    monkeypatch.setattr(garch_forecast, "_fit_one_trial", constant_trial)
+
+    result = garch_forecast.fit_garch_and_forecast(garch_returns, "studentst", [1e-4, 2e-7, 0.08, 0.9],
+                                                   n_jobs=1, use_cache=False, seed=0)
+
+    assert result["success"] and result["log_likelihood"] == 100.0
+    # No round ever improves, and the search still does not stop early
+    assert len(trials) == garch_forecast.NUM_TRIALS
+
+
+def test_server_answers_each_line(garch_returns, monkeypatch, capsys):
+    params = [1e-4, 2e-7, 0.08, 0.9]
+    lines = [
+        json.dumps({"returns": garch_returns.tolist(), "starting_values": params, "forecast_only": True}),
+        "",
+        "{not json",
+        json.dumps({"distribution": "normal"}),
+        json.dumps({"returns": [0.01, float("nan"), 0.02], "starting_values": params}),
+    ]
+    monkeypatch.setattr(garch_forecast.sys, "stdin", io.StringIO("\n".join(lines) + "\n"))
+
+    garch_forecast.serve()
+
+    replies = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(replies) == 4  # blank lines are skipped
+    expected = garch_forecast.fit_garch_and_forecast(garch_returns, "studentst", params, forecast_only=True)
+    assert replies[0] == expected and expected["success"]
+    # Malformed lines and failed fits get a reply of their own; the server keeps going
+    assert not replies[1]["success"] and replies[1]["message"].startswith("Invalid request")
+    assert not replies[2]["success"] and "returns" in replies[2]["message"]
+    assert not replies[3]["success"] and "non-finite" in replies[3]["message"]
@@ -0,0 +1,95 @@
+import warnings
+
+import numpy as np
+import pytest
+
+import garch_forecast
+import garch_kernel
+
+arch = pytest.importorskip("arch")
+
+pytestmark = pytest.mark.skipif(not garch_kernel.HAVE_KERNEL, reason="neither numba nor the Cython kernel available")
+
+DISTRIBUTIONS = ["studentst", "normal"]
+
+
+@pytest.fixture(scope="module")
+def pct_returns(garch_returns):
+    # arch's own optimizer only converges reliably on percent-scale data
+    return garch_returns * 100.0
+
+
+def arch_fit(returns, distribution):
+    model = arch.arch_model(returns, mean="Constant", vol="GARCH", p=1, q=1, dist=distribution, rescale=False)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return model.fit(disp="off", show_warning=False)
+
+
+@pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+def test_neg_loglik_matches_arch(pct_returns, distribution):
+    res = arch_fit(pct_returns, distribution)
+    params = np.asarray(res.params, dtype=np.float64)  # mu, omega, alpha[1], beta[1](, nu)
+    bc = garch_kernel.backcast(pct_returns)
+
+    value = garch_kernel.neg_loglik(params, pct_returns, garch_kernel.dist_flag(distribution), bc)
+    assert value == pytest.approx(-res.loglikelihood, rel=1e-9)
+
+    h_last = garch_kernel.last_variance(params, pct_returns, bc)
+    assert h_last == pytest.approx(res.conditional_volatility[-1] ** 2, rel=1e-9)
+
+
+@pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+def test_fit_matches_arch_optimum(pct_returns, distribution):
+    res = arch_fit(pct_returns, distribution)
+    start = [1e-2, 2e-3, 0.08, 0.9] + ([10.0] if distribution == "studentst" else [])
+
+    summary = garch_kernel.fit(pct_returns, start, distribution)
+    assert summary is not None
+    assert summary["log_likelihood"] == pytest.approx(res.loglikelihood, abs=1e-5)
+    for name, arch_name in (("alpha", "alpha[1]"), ("beta", "beta[1]")):
+        assert summary[name] == pytest.approx(res.params[arch_name], abs=1e-4)
+    assert summary["var_next"] == pytest.approx(
+        res.forecast(horizon=1, reindex=False).variance.iloc[-1, 0], rel=1e-4
+    )
+
+
+@pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+def test_kernel_search_not_worse_than_arch_search(garch_returns, distribution, monkeypatch):
+    start = [1e-4, 2e-7, 0.08, 0.9]
+    kernel = garch_forecast.fit_garch_and_forecast(garch_returns, distribution, start, n_jobs=1,
+                                                   use_cache=False, seed=1)
+
+    monkeypatch.setattr(garch_kernel, "HAVE_KERNEL", False)
+    baseline = garch_forecast.fit_garch_and_forecast(garch_returns, distribution, start, n_jobs=1,
+                                                     use_cache=False, seed=1)
+
+    assert kernel["success"] and baseline["success"]
+    assert kernel["log_likelihood"] >= baseline["log_likelihood"] - 1e-3
+
+
+@pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+def test_batch_f32_ranks_like_f64(garch_returns, distribution):
+    flag = garch_kernel.dist_flag(distribution)
+    bc = garch_kernel.backcast(garch_returns)
+    rng = np.random.default_rng(0)
+
+    candidates = np.column_stack([
+        1e-4 * np.exp(rng.normal(0.0, 0.5, 200)),
+        2e-7 * np.exp(rng.normal(0.0, 0.5, 200)),
+        rng.uniform(0.02, 0.2, 200),
+        rng.uniform(0.7, 0.95, 200),
+    ])
+    if flag == garch_kernel.DIST_STUDENTST:
+        candidates = np.column_stack([candidates, rng.uniform(3.0, 20.0, 200)])
+
+    exact = np.array([garch_kernel.neg_loglik(c, garch_returns, flag, bc) for c in candidates])
+    fast = garch_kernel.batch_neg_loglik(candidates, garch_returns.astype(np.float32), flag, bc)
+
+    feasible = exact < garch_kernel.INFEASIBLE
+    assert np.array_equal(feasible, fast < garch_kernel.INFEASIBLE)
+    np.testing.assert_allclose(fast[feasible], exact[feasible], atol=1e-2)
+    # The candidates handed to the optimizer are the same
+    top_k = garch_forecast.TOP_K
+    assert set(np.argsort(fast)[:top_k]) == set(np.argsort(exact)[:top_k])
+
@@ -0,0 +1,94 @@
+import io
+import json
+import math
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("fast_stark_crypto")
+
+import sign_order  # noqa: E402
+
+PUBLIC_KEY = "0x338f4cb92453dfb7c7764549d85ab624e6614db51b4c25c0fd63da09f07d127"
+PRIVATE_KEY = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abc"
+
+# Same vectors as src/snip12/tests.rs
+BUY = {
+    "base_asset_id": "0x534f4c2d33",
+    "quote_asset_id": "0x1",
+    "fee_asset_id": "0x1",
+    "base_amount": "100",
+    "quote_amount": "-16229000",
+    "fee_amount": "9738",
+    "position_id": "226109",
+    "nonce": "1234567890",
+    "expiration_epoch_millis": "1700000000000",
+    "public_key": PUBLIC_KEY,
+    "private_key": PRIVATE_KEY,
+}
+SELL = {**BUY, "base_amount": "-100", "quote_amount": "16229000", "nonce": "1234567891"}
+
+EXPECTED = {
+    "buy": ("0x2e0f5ae619f31304e805c49be4e853258fd69ffa704b688f4e4ec0fb334dfeb",
+            "0x6ae9a6a3fe33c66ebae0f9c500a241a1c6df2d96450d07b48c064951baf2c39"),
+    "sell": ("0x5b44364eacbb456567fa7cb10e571e5563fae9187e07c76fc39e6761ee85746",
+             "0x365743556c9ee01a97b5103d907156aecdcc63fb487acc96b28065678593745"),
+}
+
+EXPIRIES_MILLIS = [
+    1700000000000,  # whole second
+    1700000000001,  # rounds up
+    1700000000999,
+    1711846800500,  # around a European DST change
+    0,
+]
+
+
+def sdk_formula(expiry_millis):
+    """The SDK's computation, on the UTC datetime the SDK is handed."""
+    expiry = datetime.fromtimestamp(expiry_millis / 1000, tz=timezone.utc)
+    return math.ceil((expiry + timedelta(days=14)).timestamp())
+
+
+@pytest.mark.parametrize("expiry_millis", EXPIRIES_MILLIS)
+def test_settlement_expiration_matches_sdk_formula(expiry_millis):
+    assert sign_order.calculate_settlement_expiration(expiry_millis) == sdk_formula(expiry_millis)
+
+
+@pytest.mark.parametrize("expiry_millis", EXPIRIES_MILLIS)
+def test_settlement_expiration_matches_sdk(expiry_millis):
+    settlement = pytest.importorskip("x10.perpetual.order_object_settlement")
+    sdk_calc = getattr(settlement, "__calc_settlement_expiration")
+
+    expiry = datetime.fromtimestamp(expiry_millis / 1000, tz=timezone.utc)
+    assert sign_order.calculate_settlement_expiration(expiry_millis) == sdk_calc(expiry)
+
+
+@pytest.mark.parametrize("name, request_data", [("buy", BUY), ("sell", SELL)])
+def test_sign_request_matches_rust_vectors(name, request_data):
+    result = sign_order.sign_request(request_data)
+    assert (result["r"], result["s"]) == EXPECTED[name]
+
+
+def test_batch_matches_single_signatures():
+    bad = {**BUY, "base_amount": "not a number"}
+
+    results = sign_order.sign_orders_batch([BUY, bad, SELL])
+
+    assert results[0] == sign_order.sign_request(BUY)
+    assert results[2] == sign_order.sign_request(SELL)
+    # A failing order is reported in place without affecting its neighbours
+    assert set(results[1]) == {"error"}
+
+
+def test_server_answers_single_and_batch_lines(monkeypatch, capsys):
+    lines = [json.dumps(BUY), "", json.dumps({"batch": [BUY, SELL]}), "{not json"]
+    monkeypatch.setattr(sign_order.sys, "stdin", io.StringIO("\n".join(lines) + "\n"))
+
+    sign_order.serve()
+
+    replies = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    single = sign_order.sign_request(BUY)
+    assert replies[0] == single
+    assert replies[1] == {"batch": [single, sign_order.sign_request(SELL)]}
+    assert set(replies[2]) == {"error"}